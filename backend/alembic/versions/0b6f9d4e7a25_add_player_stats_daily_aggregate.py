@@ -0,0 +1,56 @@
+"""Add player_stats_daily continuous aggregate
+
+Revision ID: 0b6f9d4e7a25
+Revises: f5e8a3b7c902
+Create Date: 2025-10-05 10:31:56.224190
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0b6f9d4e7a25'
+down_revision = 'f5e8a3b7c902'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Ordered-set aggregates (percentile_cont) are not allowed in continuous
+    # aggregates, so the rollup keeps avg/min/max/stddev/count.
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS player_stats_daily
+        WITH (timescaledb.continuous) AS
+        SELECT user_id,
+               stat_type,
+               time_bucket(INTERVAL '1 day', time) AS bucket,
+               avg(value) AS avg_value,
+               min(value) AS min_value,
+               max(value) AS max_value,
+               stddev(value) AS stddev_value,
+               count(*) AS sample_count
+        FROM player_stats
+        GROUP BY user_id, stat_type, bucket
+        WITH NO DATA
+    """)
+    op.execute("""
+        SELECT add_continuous_aggregate_policy('player_stats_daily',
+            start_offset => INTERVAL '30 days',
+            end_offset => INTERVAL '1 hour',
+            schedule_interval => INTERVAL '15 minutes',
+            if_not_exists => TRUE)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_player_stats_daily_user_stat_bucket
+        ON player_stats_daily (user_id, stat_type, bucket DESC)
+    """)
+
+    # The view is created empty; backfill existing rows. Refreshing cannot
+    # run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("CALL refresh_continuous_aggregate('player_stats_daily', NULL, NULL)")
+
+
+def downgrade() -> None:
+    op.execute("SELECT remove_continuous_aggregate_policy('player_stats_daily', if_exists => TRUE)")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS player_stats_daily")
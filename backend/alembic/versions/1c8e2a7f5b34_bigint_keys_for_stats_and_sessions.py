@@ -0,0 +1,82 @@
+"""Use bigint identity keys for player_stats and training_sessions
+
+Revision ID: 1c8e2a7f5b34
+Revises: 0b6f9d4e7a25
+Create Date: 2025-10-05 13:47:22.619044
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = '1c8e2a7f5b34'
+down_revision = '0b6f9d4e7a25'
+branch_labels = None
+depends_on = None
+
+
+def _disable_player_stats_compression() -> None:
+    # TimescaleDB rejects identity and NOT NULL columns without a constant
+    # default while compression is enabled, even on decompressed chunks.
+    op.execute("SELECT remove_compression_policy('player_stats', if_exists => TRUE)")
+    op.execute(
+        "SELECT decompress_chunk(c, if_compressed => TRUE) "
+        "FROM show_chunks('player_stats') c"
+    )
+    op.execute("ALTER TABLE player_stats SET (timescaledb.compress = false)")
+
+
+def _enable_player_stats_compression() -> None:
+    # Same settings as revision d93a0f6c2e71; the policy recompresses the
+    # decompressed chunks on its next run.
+    op.execute(
+        "ALTER TABLE player_stats SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'user_id, stat_type', "
+        "timescaledb.compress_orderby = 'time DESC')"
+    )
+    op.execute(
+        sa.text(
+            "SELECT add_compression_policy('player_stats', "
+            "CAST(:compress_after AS INTERVAL), if_not_exists => TRUE)"
+        ).bindparams(compress_after=settings.timescale_compress_after)
+    )
+
+
+def upgrade() -> None:
+    # player_stats ids are internal only, so the UUID column is replaced.
+    _disable_player_stats_compression()
+    op.drop_constraint('player_stats_pkey', 'player_stats', type_='primary')
+    op.drop_column('player_stats', 'id')
+    op.add_column('player_stats', sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False))
+    op.create_primary_key('player_stats_pkey', 'player_stats', ['id', 'time'])
+    _enable_player_stats_compression()
+
+    # training_sessions ids are returned by the API; keep them as public_id.
+    op.drop_constraint('training_sessions_pkey', 'training_sessions', type_='primary')
+    op.alter_column('training_sessions', 'id', new_column_name='public_id')
+    op.create_unique_constraint('training_sessions_public_id_key', 'training_sessions', ['public_id'])
+    op.add_column('training_sessions', sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False))
+    op.create_primary_key('training_sessions_pkey', 'training_sessions', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('training_sessions_pkey', 'training_sessions', type_='primary')
+    op.drop_column('training_sessions', 'id')
+    op.drop_constraint('training_sessions_public_id_key', 'training_sessions', type_='unique')
+    op.alter_column('training_sessions', 'public_id', new_column_name='id')
+    op.create_primary_key('training_sessions_pkey', 'training_sessions', ['id'])
+
+    _disable_player_stats_compression()
+    op.drop_constraint('player_stats_pkey', 'player_stats', type_='primary')
+    op.drop_column('player_stats', 'id')
+    op.add_column(
+        'player_stats',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
+    )
+    op.create_primary_key('player_stats_pkey', 'player_stats', ['id', 'time'])
+    _enable_player_stats_compression()
@@ -0,0 +1,34 @@
+"""Generate UUID keys in the database with gen_random_uuid()
+
+Revision ID: 2d5a9c1e8f67
+Revises: 1c8e2a7f5b34
+Create Date: 2025-10-05 16:09:41.377520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d5a9c1e8f67'
+down_revision = '1c8e2a7f5b34'
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = (
+    ('users', 'id'),
+    ('matches', 'id'),
+    ('training_packs', 'id'),
+    ('training_sessions', 'public_id'),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table, column in UUID_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table, column in UUID_COLUMNS:
+        op.alter_column(table, column, server_default=None)
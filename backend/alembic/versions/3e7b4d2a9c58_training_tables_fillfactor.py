@@ -0,0 +1,37 @@
+"""Lower fillfactor on training tables for HOT updates
+
+Revision ID: 3e7b4d2a9c58
+Revises: 2d5a9c1e8f67
+Create Date: 2025-10-06 09:18:04.551836
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3e7b4d2a9c58'
+down_revision = '2d5a9c1e8f67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Only pages written from now on get the free space; existing pages
+    # pick it up when the table is next rewritten.
+    op.execute(
+        "ALTER TABLE training_packs SET ("
+        "fillfactor = 80, "
+        "autovacuum_vacuum_scale_factor = 0.05, "
+        "autovacuum_analyze_scale_factor = 0.02)"
+    )
+    op.execute("ALTER TABLE training_sessions SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE training_sessions RESET (fillfactor)")
+    op.execute(
+        "ALTER TABLE training_packs RESET ("
+        "fillfactor, "
+        "autovacuum_vacuum_scale_factor, "
+        "autovacuum_analyze_scale_factor)"
+    )
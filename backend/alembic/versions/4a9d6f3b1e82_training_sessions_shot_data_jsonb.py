@@ -0,0 +1,41 @@
+"""Store training_sessions.shot_data as JSONB
+
+Revision ID: 4a9d6f3b1e82
+Revises: 3e7b4d2a9c58
+Create Date: 2025-10-06 11:42:37.906153
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4a9d6f3b1e82'
+down_revision = '3e7b4d2a9c58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'training_sessions', 'shot_data',
+        type_=postgresql.JSONB(),
+        postgresql_using='shot_data::jsonb',
+    )
+    op.create_index(
+        'idx_training_sessions_shot_data',
+        'training_sessions',
+        ['shot_data'],
+        postgresql_using='gin',
+        postgresql_where=sa.text('shot_data IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_training_sessions_shot_data', table_name='training_sessions')
+    op.alter_column(
+        'training_sessions', 'shot_data',
+        type_=sa.JSON(),
+        postgresql_using='shot_data::json',
+    )
@@ -0,0 +1,32 @@
+"""Add hash indexes for equality lookups on users and training_packs
+
+Revision ID: 5b2e8a4c7d19
+Revises: 4a9d6f3b1e82
+Create Date: 2025-10-06 14:26:50.318472
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2e8a4c7d19'
+down_revision = '4a9d6f3b1e82'
+branch_labels = None
+depends_on = None
+
+HASH_INDEXES = (
+    ('idx_training_packs_code_hash', 'training_packs', 'code'),
+    ('idx_users_steam_id_hash', 'users', 'steam_id'),
+    ('idx_users_epic_id_hash', 'users', 'epic_id'),
+    ('idx_users_email_hash', 'users', 'email'),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in HASH_INDEXES:
+        op.create_index(name, table, [column], postgresql_using='hash')
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(HASH_INDEXES):
+        op.drop_index(name, table_name=table)
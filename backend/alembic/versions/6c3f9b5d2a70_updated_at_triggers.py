@@ -0,0 +1,36 @@
+"""Maintain updated_at with a trigger on users and training_packs
+
+Revision ID: 6c3f9b5d2a70
+Revises: 5b2e8a4c7d19
+Create Date: 2025-10-07 10:03:29.745118
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6c3f9b5d2a70'
+down_revision = '5b2e8a4c7d19'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'training_packs')
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at := now(); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
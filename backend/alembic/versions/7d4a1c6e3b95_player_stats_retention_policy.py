@@ -0,0 +1,33 @@
+"""Add a retention policy on player_stats
+
+Revision ID: 7d4a1c6e3b95
+Revises: 6c3f9b5d2a70
+Create Date: 2025-10-07 13:51:12.082467
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = '7d4a1c6e3b95'
+down_revision = '6c3f9b5d2a70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # player_stats_daily only refreshes the last 30 days, so its older
+    # buckets survive raw chunks being dropped.
+    op.execute(
+        sa.text(
+            "SELECT add_retention_policy('player_stats', "
+            "make_interval(days => :retention_days), if_not_exists => TRUE)"
+        ).bindparams(retention_days=settings.player_stats_retention_days)
+    )
+
+
+def downgrade() -> None:
+    op.execute("SELECT remove_retention_policy('player_stats', if_exists => TRUE)")
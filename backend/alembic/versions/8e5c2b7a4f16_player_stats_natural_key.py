@@ -0,0 +1,67 @@
+"""Add a natural key to player_stats so re-inserted match stats are skipped
+
+Revision ID: 8e5c2b7a4f16
+Revises: 7d4a1c6e3b95
+Create Date: 2025-10-06 10:12:48.530271
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = '8e5c2b7a4f16'
+down_revision = '7d4a1c6e3b95'
+branch_labels = None
+depends_on = None
+
+
+def _disable_player_stats_compression() -> None:
+    # TimescaleDB can't add a unique index while compression is enabled.
+    op.execute("SELECT remove_compression_policy('player_stats', if_exists => TRUE)")
+    op.execute(
+        "SELECT decompress_chunk(c, if_compressed => TRUE) "
+        "FROM show_chunks('player_stats') c"
+    )
+    op.execute("ALTER TABLE player_stats SET (timescaledb.compress = false)")
+
+
+def _enable_player_stats_compression() -> None:
+    # Same settings as revision d93a0f6c2e71; the policy recompresses the
+    # decompressed chunks on its next run.
+    op.execute(
+        "ALTER TABLE player_stats SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'user_id, stat_type', "
+        "timescaledb.compress_orderby = 'time DESC')"
+    )
+    op.execute(
+        sa.text(
+            "SELECT add_compression_policy('player_stats', "
+            "CAST(:compress_after AS INTERVAL), if_not_exists => TRUE)"
+        ).bindparams(compress_after=settings.timescale_compress_after)
+    )
+
+
+def upgrade() -> None:
+    _disable_player_stats_compression()
+    # Keep the first copy of any stats a reprocessed match already inserted twice
+    op.execute(
+        "DELETE FROM player_stats a USING player_stats b "
+        "WHERE a.match_id = b.match_id AND a.user_id = b.user_id "
+        "AND a.stat_type = b.stat_type AND a.time = b.time AND a.id > b.id"
+    )
+    # Includes time, the partitioning column, as TimescaleDB requires
+    op.create_index(
+        'uq_player_stats_match_user_stat_time',
+        'player_stats',
+        ['match_id', 'user_id', 'stat_type', 'time'],
+        unique=True,
+    )
+    _enable_player_stats_compression()
+
+
+def downgrade() -> None:
+    op.drop_index('uq_player_stats_match_user_stat_time', table_name='player_stats')
@@ -0,0 +1,42 @@
+"""Convert player_stats into a TimescaleDB hypertable
+
+Revision ID: c41d7e2b9f10
+Revises: a8cd459389e0
+Create Date: 2025-10-04 14:12:31.508214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7e2b9f10'
+down_revision = 'a8cd459389e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+
+    # Hypertables need the partitioning column in every unique constraint,
+    # and create_hypertable builds its own index on time.
+    op.execute("DROP INDEX IF EXISTS ix_player_stats_time")
+    op.execute("ALTER TABLE player_stats DROP CONSTRAINT IF EXISTS player_stats_pkey")
+    op.create_primary_key('player_stats_pkey', 'player_stats', ['id', 'time'])
+
+    op.execute(
+        sa.text(
+            "SELECT create_hypertable('player_stats', 'time', "
+            "chunk_time_interval => CAST(:chunk_interval AS INTERVAL), "
+            "if_not_exists => TRUE, migrate_data => TRUE)"
+        ).bindparams(chunk_interval=settings.timescale_chunk_time_interval)
+    )
+
+
+def downgrade() -> None:
+    # A hypertable cannot be converted back to a plain table in place, and
+    # its primary key must keep the time column, so only the index is restored.
+    op.create_index('ix_player_stats_time', 'player_stats', ['time'])
@@ -0,0 +1,44 @@
+"""Enable columnstore compression on player_stats
+
+Revision ID: d93a0f6c2e71
+Revises: c41d7e2b9f10
+Create Date: 2025-10-04 15:40:07.113962
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'd93a0f6c2e71'
+down_revision = 'c41d7e2b9f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Segment by the lookup keys so per-user reads only decompress their own
+    # segments; rows inside a segment are kept newest first.
+    op.execute(
+        "ALTER TABLE player_stats SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'user_id, stat_type', "
+        "timescaledb.compress_orderby = 'time DESC')"
+    )
+    op.execute(
+        sa.text(
+            "SELECT add_compression_policy('player_stats', "
+            "CAST(:compress_after AS INTERVAL), if_not_exists => TRUE)"
+        ).bindparams(compress_after=settings.timescale_compress_after)
+    )
+
+
+def downgrade() -> None:
+    op.execute("SELECT remove_compression_policy('player_stats', if_exists => TRUE)")
+    op.execute(
+        "SELECT decompress_chunk(c, if_compressed => TRUE) "
+        "FROM show_chunks('player_stats') c"
+    )
+    op.execute("ALTER TABLE player_stats SET (timescaledb.compress = false)")
@@ -0,0 +1,27 @@
+"""Drop single-column player_stats indexes covered by compound ones
+
+Revision ID: e27b5c8d1a43
+Revises: d93a0f6c2e71
+Create Date: 2025-10-04 16:22:48.870521
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e27b5c8d1a43'
+down_revision = 'd93a0f6c2e71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # idx_player_stats_user_time and idx_player_stats_type_time lead with
+    # these columns and answer the same lookups.
+    op.execute("DROP INDEX IF EXISTS ix_player_stats_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_player_stats_stat_type")
+
+
+def downgrade() -> None:
+    op.create_index('ix_player_stats_stat_type', 'player_stats', ['stat_type'])
+    op.create_index('ix_player_stats_user_id', 'player_stats', ['user_id'])
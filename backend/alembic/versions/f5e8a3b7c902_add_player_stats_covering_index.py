@@ -0,0 +1,30 @@
+"""Add covering index for per-user stat history on player_stats
+
+Revision ID: f5e8a3b7c902
+Revises: e27b5c8d1a43
+Create Date: 2025-10-04 17:05:13.402917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5e8a3b7c902'
+down_revision = 'e27b5c8d1a43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # TimescaleDB propagates hypertable indexes to every chunk.
+    op.create_index(
+        'idx_player_stats_user_stat_time_covering',
+        'player_stats',
+        ['user_id', 'stat_type', sa.text('time DESC')],
+        postgresql_include=['value'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_player_stats_user_stat_time_covering', table_name='player_stats')
@@ -5,17 +5,17 @@ from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, insert
 import structlog
 
 from app.database import get_db
 from app.models.user import User
 from app.models.match import Match
 from app.api.auth import get_current_user
-from app.schemas.replay import ReplayResponse, ReplayUpload, ReplayAnalysis, ReplaySearchRequest, ReplaySearchResponse, PlayerStats
+from app.schemas.replay import ReplayResponse, ReplayUpload, ReplayBatchUpload, ReplayAnalysis, ReplaySearchRequest, ReplaySearchResponse, PlayerStats
 from app.schemas.coaching import CoachingInsights, CoachingInsightsResponse, WeaknessAnalysisRequest, AnalysisContext
-from app.services.replay_service import ReplayService
-from app.services.ballchasing_service import ballchasing_service
+from app.services.replay_service import ReplayService, BALLCHASING_BATCH_SIZE
+from app.services.ballchasing_service import BallchasingService, get_ballchasing_service
 from app.services.weakness_detection_service import WeaknessDetectionService
 from app.celery_app import celery_app
 
@@ -100,7 +100,6 @@ async def upload_replay(
 
 @router.post("/ballchasing-import", response_model=ReplayResponse)
 async def import_from_ballchasing(
-    background_tasks: BackgroundTasks,
     replay_data: ReplayUpload,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -135,18 +134,15 @@ async def import_from_ballchasing(
         db.commit()
         db.refresh(match)
         
-        # Queue background processing
-        background_tasks.add_task(
-            ReplayService.process_ballchasing_replay,
-            match_id=str(match.id),
-            ballchasing_id=replay_data.ballchasing_id
-        )
+        # Queue background processing on the replay worker
+        task_ids = ReplayService.queue_ballchasing_batches([str(match.id)])
         
         logger.info(
             "Ballchasing replay imported for processing",
             user_id=str(current_user.id),
             match_id=str(match.id),
-            ballchasing_id=replay_data.ballchasing_id
+            ballchasing_id=replay_data.ballchasing_id,
+            task_id=task_ids[0]
         )
         
         return ReplayResponse(
@@ -154,7 +150,8 @@ async def import_from_ballchasing(
             ballchasing_id=replay_data.ballchasing_id,
             status="processing",
             message="Replay imported successfully and is being processed",
-            uploaded_at=match.created_at
+            uploaded_at=match.created_at,
+            task_id=task_ids[0]
         )
         
     except Exception as e:
@@ -165,6 +162,85 @@ async def import_from_ballchasing(
         )
 
 
+@router.post("/ballchasing-import/batch", response_model=List[ReplayResponse])
+async def import_many_from_ballchasing(
+    replay_data: ReplayBatchUpload,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Import several replays from Ballchasing.com using their replay IDs."""
+    ballchasing_ids = list(dict.fromkeys(replay_data.ballchasing_ids))
+    
+    # Skip replays that were imported before
+    existing_ids = {
+        ballchasing_id for (ballchasing_id,) in db.query(Match.ballchasing_id).filter(
+            Match.ballchasing_id.in_(ballchasing_ids)
+        )
+    }
+    new_ids = [ballchasing_id for ballchasing_id in ballchasing_ids if ballchasing_id not in existing_ids]
+    
+    if not new_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Replays already imported"
+        )
+    
+    try:
+        # Create all match records with one INSERT; placeholders are
+        # filled in when the batch is processed
+        now = datetime.utcnow()
+        rows = db.execute(
+            insert(Match).returning(Match.id, Match.ballchasing_id, Match.created_at),
+            [
+                {
+                    'user_id': current_user.id,
+                    'ballchasing_id': ballchasing_id,
+                    'playlist': "unknown",
+                    'duration': 0,
+                    'match_date': now,
+                    'score_team_0': 0,
+                    'score_team_1': 0,
+                    'result': "unknown",
+                    'processed': False,
+                }
+                for ballchasing_id in new_ids
+            ]
+        ).all()
+        db.commit()
+        
+        # Queue the matches in chunks; each chunk is fetched concurrently and
+        # written back with a single UPDATE
+        match_ids = [str(row.id) for row in rows]
+        task_ids = ReplayService.queue_ballchasing_batches(match_ids)
+        
+        logger.info(
+            "Ballchasing replays imported for processing",
+            user_id=str(current_user.id),
+            imported=len(rows),
+            skipped=len(existing_ids),
+            task_count=len(task_ids)
+        )
+        
+        return [
+            ReplayResponse(
+                id=str(row.id),
+                ballchasing_id=row.ballchasing_id,
+                status="processing",
+                message="Replay imported successfully and is being processed",
+                uploaded_at=row.created_at,
+                task_id=task_ids[i // BALLCHASING_BATCH_SIZE]
+            )
+            for i, row in enumerate(rows)
+        ]
+        
+    except Exception as e:
+        logger.error("Ballchasing batch import failed", user_id=str(current_user.id), error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import replays"
+        )
+
+
 @router.get("/{replay_id}/analysis", response_model=ReplayAnalysis)
 async def get_replay_analysis(
     replay_id: str,
@@ -462,7 +538,8 @@ async def delete_replay(
 @router.post("/search-ballchasing", response_model=ReplaySearchResponse)
 async def search_ballchasing_replays(
     search_request: ReplaySearchRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    ballchasing_service: BallchasingService = Depends(get_ballchasing_service)
 ):
     """Search for replays on Ballchasing.com."""
     try:
@@ -525,7 +602,8 @@ async def search_ballchasing_replays(
 @router.get("/ballchasing/{replay_id}/preview")
 async def preview_ballchasing_replay(
     replay_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    ballchasing_service: BallchasingService = Depends(get_ballchasing_service)
 ):
     """Preview a Ballchasing.com replay before importing."""
     try:
@@ -162,13 +162,13 @@ async def create_training_session(
         logger.info(
             "Training session logged",
             user_id=str(current_user.id),
-            session_id=str(session.id),
+            session_id=str(session.public_id),
             pack_code=training_pack.code,
             accuracy=accuracy
         )
         
         return TrainingSessionResponse(
-            id=str(session.id),
+            id=str(session.public_id),
             training_pack_id=str(session.training_pack_id),
             training_pack_name=training_pack.name,
             training_pack_code=training_pack.code,
@@ -210,7 +210,7 @@ async def get_training_sessions(
     
     return [
         TrainingSessionResponse(
-            id=str(session.id),
+            id=str(session.public_id),
             training_pack_id=str(session.training_pack_id),
             training_pack_name=session.training_pack.name,
             training_pack_code=session.training_pack.code,
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    timescale_chunk_time_interval: str = "7 days"
+    timescale_compress_after: str = "7 days"
+    player_stats_retention_days: int = 730
     
     # Redis
     redis_url: str
@@ -1,14 +1,25 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+import orjson
 import redis.asyncio as redis
 
 from app.config import settings
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson.
+
+    Match analysis and coaching payloads are written on every processed replay;
+    orjson is several times faster than the json module.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # SQLAlchemy setup with optimized connection pooling for production load
 # Optimized settings for concurrent ML API requests
 engine = create_engine(
@@ -20,6 +31,9 @@ engine = create_engine(
     max_overflow=30,        # Additional connections (increased from 10)
     pool_timeout=5,         # Connection timeout in seconds (decreased from 30)
     pool_recycle=3600,      # Recycle connections every hour
+    # JSON/JSONB columns are encoded and decoded with orjson
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     # Additional optimizations
     connect_args={
         "connect_timeout": 10,
@@ -31,6 +45,18 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Shared trigger function that stamps updated_at on every UPDATE, including
+# bulk and raw SQL updates that bypass the ORM.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at := now(); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    ).execute_if(dialect="postgresql"),
+)
+
 # Redis setup
 redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
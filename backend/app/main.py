@@ -5,11 +5,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from app.config import settings
 from app.database import init_db, close_db
+from app.services.ballchasing_service import close_ballchasing_service
 from app.api import auth, users, replays, training, health
 from app.api.ml import router as ml_router
 from app.api.ml.exceptions import MLModelError
@@ -45,6 +46,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down RocketTrainer API")
+    await close_ballchasing_service()
     await close_db()
 
 
@@ -56,6 +58,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Security middleware
@@ -42,6 +42,7 @@ class SkillAnalyzer:
 
         # Initialize model components
         self.model = None
+        self.feature_binner = None
         self.is_trained = False
 
         # Try to load pre-trained model
@@ -84,6 +85,10 @@ class SkillAnalyzer:
                 if os.path.exists(pipeline_path):
                     self.feature_pipeline = joblib.load(pipeline_path)
 
+                binner_path = os.path.join(model_dir, "feature_binner.joblib")
+                if os.path.exists(binner_path):
+                    self.feature_binner = joblib.load(binner_path)
+
                 logger.info("Loaded pre-trained skill analyzer model",
                            model_path=model_path)
             else:
@@ -153,6 +158,9 @@ class SkillAnalyzer:
         if X.shape[0] == 0:
             return {"error": "No features extracted from matches"}
 
+        if self.feature_binner is not None:
+            X = self.feature_binner.transform(X).astype(np.uint8)
+
         # Predict skill scores using trained model
         skill_predictions = self.model.predict(X)
 
@@ -53,6 +53,7 @@ class WeaknessDetector(BaseMLModel):
         self.model = None
         self.label_encoder = None
         self.feature_pipeline = None
+        self.feature_binner = None
 
         # Try to load pre-trained model
         self._load_trained_model()
@@ -83,12 +84,16 @@ class WeaknessDetector(BaseMLModel):
         model_path = os.path.join(model_dir, "weakness_detector.joblib")
         encoder_path = os.path.join(model_dir, "weakness_detector_encoder.joblib")
         pipeline_path = os.path.join(model_dir, "weakness_detector_pipeline.joblib")
+        binner_path = os.path.join(model_dir, "feature_binner.joblib")
 
         try:
             if all(os.path.exists(p) for p in [model_path, encoder_path, pipeline_path]):
                 self.model = joblib.load(model_path)
                 self.label_encoder = joblib.load(encoder_path)
                 self.feature_pipeline = joblib.load(pipeline_path)
+                # Models trained on binned features ship the binner alongside them
+                if os.path.exists(binner_path):
+                    self.feature_binner = joblib.load(binner_path)
                 self.is_trained = True
 
                 logger.info("Loaded pre-trained weakness detector model",
@@ -279,6 +284,9 @@ class WeaknessDetector(BaseMLModel):
             logger.warning("No features extracted for prediction")
             return []
 
+        if self.feature_binner is not None:
+            X = self.feature_binner.transform(X).astype(np.uint8)
+
         # Make predictions
         y_pred = self.model.predict(X)
         y_pred_proba = self.model.predict_proba(X)
@@ -10,23 +10,45 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any, Union
 from datetime import datetime
+import hashlib
 import pickle
 import os
+from concurrent.futures import ProcessPoolExecutor
 import structlog
+
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingClassifier
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
-from sklearn.metrics import classification_report, mean_squared_error, r2_score
-from sklearn.preprocessing import LabelEncoder
+from sklearn.model_selection import StratifiedShuffleSplit, cross_val_score, GridSearchCV
+from sklearn.metrics import accuracy_score, classification_report, mean_squared_error, r2_score
+from sklearn.preprocessing import KBinsDiscretizer, LabelEncoder
 import joblib
 
 from .synthetic_data_generator import SyntheticDataGenerator
 from ..features.pipeline import FeatureEngineeringPipeline
 from ..config import ml_config
-from ..utils import performance_monitor
-from ...models.match import Match
+from ..utils import MODEL_COMPRESSION, performance_monitor
 
 logger = structlog.get_logger(__name__)
 
+# Features are quantized to this many bins so they fit in uint8
+FEATURE_BINS = 255
+
+
+def _forest_estimators() -> Tuple[type, type]:
+    """Get the random forest classifier and regressor classes to train with.
+
+    Uses the Intel oneDAL implementations from sklearnex when it is installed.
+    They are imported directly instead of through patch_sklearn(), so sklearn
+    stays unpatched for the rest of the process.
+    """
+    try:
+        from sklearnex.ensemble import (
+            RandomForestClassifier as AcceleratedClassifier,
+            RandomForestRegressor as AcceleratedRegressor,
+        )
+    except ImportError:
+        return RandomForestClassifier, RandomForestRegressor
+    return AcceleratedClassifier, AcceleratedRegressor
+
 
 class ModelTrainer:
     """Trains ML models for RocketTrainer."""
@@ -51,11 +73,23 @@ class ModelTrainer:
         self.data_generator = SyntheticDataGenerator()
         self.feature_pipeline = FeatureEngineeringPipeline()
         self.label_encoder = LabelEncoder()
+        self.feature_binner = KBinsDiscretizer(
+            n_bins=FEATURE_BINS,
+            encode='ordinal',
+            strategy='quantile',
+            subsample=200_000,
+            random_state=ml_config.random_state,
+            dtype=np.float32
+        )
+
+        # Train/test split indices shared by all trainers, keyed by label content
+        self._split_indices: Dict[bytes, Tuple[np.ndarray, np.ndarray]] = {}
         
         # Model configurations
+        classifier_class, regressor_class = _forest_estimators()
         self.model_configs = {
             "weakness_detector": {
-                "model_class": RandomForestClassifier,
+                "model_class": classifier_class,
                 "params": {
                     "n_estimators": 100,
                     "max_depth": 10,
@@ -71,7 +105,7 @@ class ModelTrainer:
                 }
             },
             "skill_analyzer": {
-                "model_class": RandomForestRegressor,
+                "model_class": regressor_class,
                 "params": {
                     "n_estimators": 100,
                     "max_depth": 12,
@@ -90,7 +124,8 @@ class ModelTrainer:
         
         logger.info("ModelTrainer initialized",
                    save_dir=model_save_dir,
-                   use_synthetic=use_synthetic_data)
+                   use_synthetic=use_synthetic_data,
+                   estimator_module=classifier_class.__module__)
     
     def prepare_training_data(self, 
                             num_players: int = 1000,
@@ -113,29 +148,39 @@ class ModelTrainer:
         return features_df, labels_dict
     
     def train_weakness_detector(self, 
-                              features_df: pd.DataFrame,
+                              features_df: Optional[pd.DataFrame],
                               labels_dict: Dict[str, np.ndarray],
-                              optimize_hyperparams: bool = False) -> Dict[str, Any]:
+                              optimize_hyperparams: bool = False,
+                              X: Optional[np.ndarray] = None,
+                              n_jobs: Optional[int] = None) -> Dict[str, Any]:
         """Train the weakness detection model."""
         logger.info("Training weakness detector model")
         
-        # Convert match data to Match objects for feature pipeline
-        matches = self._dataframe_to_matches(features_df)
-
-        # Prepare labels first
         y = labels_dict["primary_weakness"]
-        y_encoded = self.label_encoder.fit_transform(y)
+        
+        # Split data (stratified on weakness; the bins are fitted on train rows only)
+        train_idx, test_idx = self._get_split_indices(y)
+        
+        if X is None:
+            # Convert match data to Match objects for feature pipeline
+            matches = self._dataframe_to_matches(features_df)
 
-        # Extract features using pipeline with target labels for feature selection
-        X = self.feature_pipeline.fit_transform(matches, target_labels=y_encoded)
+            # Prepare labels first
+            y_encoded = self._encode_weakness_labels(y, fit=True)
+
+            # Extract features using pipeline with target labels for feature selection
+            X = self.feature_pipeline.fit_transform(matches, target_labels=y_encoded)
+            X = self._bin_features(X, fit_rows=train_idx)
+        else:
+            # Features were precomputed with an already fitted pipeline and encoder
+            y_encoded = self._encode_weakness_labels(y, fit=False)
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_encoded, test_size=0.2, random_state=ml_config.random_state, stratify=y_encoded
-        )
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y_encoded[train_idx], y_encoded[test_idx]
         
         # Get model configuration
         config = self.model_configs["weakness_detector"]
+        params = self._resolve_params(config, n_jobs)
         
         if optimize_hyperparams:
             # Hyperparameter optimization
@@ -145,7 +190,7 @@ class ModelTrainer:
                 config["param_grid"],
                 cv=5,
                 scoring='accuracy',
-                n_jobs=-1,
+                n_jobs=params["n_jobs"],
                 verbose=1
             )
             grid_search.fit(X_train, y_train)
@@ -154,19 +199,19 @@ class ModelTrainer:
             logger.info("Best parameters found", params=best_params)
         else:
             # Use default parameters
-            model = config["model_class"](**config["params"])
+            model = config["model_class"](**params)
             model.fit(X_train, y_train)
         
+        # Predictions for evaluation (computed once, reused by every metric)
+        y_pred = model.predict(X_test)
+        
         # Evaluate model
         train_score = model.score(X_train, y_train)
-        test_score = model.score(X_test, y_test)
+        test_score = accuracy_score(y_test, y_pred)
         
         # Cross-validation
         cv_scores = cross_val_score(model, X_train, y_train, cv=5)
         
-        # Predictions for detailed evaluation
-        y_pred = model.predict(X_test)
-        
         # Classification report
         class_names = self.label_encoder.classes_
         report = classification_report(y_test, y_pred, target_names=class_names, output_dict=True)
@@ -181,10 +226,12 @@ class ModelTrainer:
         model_path = os.path.join(self.model_save_dir, "weakness_detector.joblib")
         encoder_path = os.path.join(self.model_save_dir, "weakness_detector_encoder.joblib")
         pipeline_path = os.path.join(self.model_save_dir, "weakness_detector_pipeline.joblib")
+        binner_path = os.path.join(self.model_save_dir, "feature_binner.joblib")
         
-        joblib.dump(model, model_path)
-        joblib.dump(self.label_encoder, encoder_path)
-        joblib.dump(self.feature_pipeline, pipeline_path)
+        joblib.dump(model, model_path, compress=MODEL_COMPRESSION)
+        joblib.dump(self.label_encoder, encoder_path, compress=MODEL_COMPRESSION)
+        joblib.dump(self.feature_pipeline, pipeline_path, compress=MODEL_COMPRESSION)
+        joblib.dump(self.feature_binner, binner_path, compress=MODEL_COMPRESSION)
         
         training_results = {
             "model_type": "weakness_detector",
@@ -197,6 +244,7 @@ class ModelTrainer:
             "model_path": model_path,
             "encoder_path": encoder_path,
             "pipeline_path": pipeline_path,
+            "binner_path": binner_path,
             "training_samples": len(X_train),
             "test_samples": len(X_test),
             "num_classes": len(class_names),
@@ -212,31 +260,40 @@ class ModelTrainer:
         return training_results
     
     def train_skill_analyzer(self,
-                           features_df: pd.DataFrame,
+                           features_df: Optional[pd.DataFrame],
                            labels_dict: Dict[str, np.ndarray],
-                           optimize_hyperparams: bool = False) -> Dict[str, Any]:
+                           optimize_hyperparams: bool = False,
+                           X: Optional[np.ndarray] = None,
+                           n_jobs: Optional[int] = None) -> Dict[str, Any]:
         """Train the skill analysis model."""
         logger.info("Training skill analyzer model")
         
-        # Convert match data to Match objects for feature pipeline
-        matches = self._dataframe_to_matches(features_df)
+        # Split data (same folds as the weakness detector, stratified on weakness)
+        train_idx, test_idx = self._get_split_indices(labels_dict["primary_weakness"])
         
-        # Extract features using pipeline (reuse fitted pipeline from weakness detector)
-        if not self.feature_pipeline.is_fitted:
-            X = self.feature_pipeline.fit_transform(matches)
-        else:
-            X = self.feature_pipeline.transform(matches)
+        if X is None:
+            # Convert match data to Match objects for feature pipeline
+            matches = self._dataframe_to_matches(features_df)
+
+            # Extract features using pipeline (reuse fitted pipeline from weakness detector)
+            if not self.feature_pipeline.is_fitted:
+                X = self.feature_pipeline.fit_transform(matches)
+                X = self._bin_features(X, fit_rows=train_idx)
+            else:
+                X = self.feature_pipeline.transform(matches)
+                X = self._bin_features(X)
         
         # Prepare labels (skill scores for all categories)
-        y = labels_dict["skill_scores"]  # Shape: (n_samples, n_skill_categories)
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=ml_config.random_state
+        y = np.ascontiguousarray(  # Shape: (n_samples, n_skill_categories)
+            labels_dict["skill_scores"], dtype=np.float32
         )
         
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
+        
         # Get model configuration
         config = self.model_configs["skill_analyzer"]
+        params = self._resolve_params(config, n_jobs)
         
         if optimize_hyperparams:
             # Hyperparameter optimization
@@ -246,7 +303,7 @@ class ModelTrainer:
                 config["param_grid"],
                 cv=5,
                 scoring='neg_mean_squared_error',
-                n_jobs=-1,
+                n_jobs=params["n_jobs"],
                 verbose=1
             )
             grid_search.fit(X_train, y_train)
@@ -255,30 +312,26 @@ class ModelTrainer:
             logger.info("Best parameters found", params=best_params)
         else:
             # Use default parameters
-            model = config["model_class"](**config["params"])
+            model = config["model_class"](**params)
             model.fit(X_train, y_train)
         
-        # Evaluate model
-        train_score = model.score(X_train, y_train)
-        test_score = model.score(X_test, y_test)
-        
-        # Predictions for detailed evaluation
+        # Predictions for evaluation (computed once, reused by every metric)
         y_pred = model.predict(X_test)
         
-        # Calculate metrics
-        mse = mean_squared_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
-        
         # Per-skill category performance
+        skill_mse = mean_squared_error(y_test, y_pred, multioutput='raw_values')
+        skill_r2 = r2_score(y_test, y_pred, multioutput='raw_values')
         skill_categories = self.data_generator.skill_categories
-        skill_metrics = {}
-        for i, skill in enumerate(skill_categories):
-            skill_mse = mean_squared_error(y_test[:, i], y_pred[:, i])
-            skill_r2 = r2_score(y_test[:, i], y_pred[:, i])
-            skill_metrics[skill] = {
-                "mse": float(skill_mse),
-                "r2": float(skill_r2)
-            }
+        skill_metrics = {
+            skill: {"mse": float(skill_mse[i]), "r2": float(skill_r2[i])}
+            for i, skill in enumerate(skill_categories)
+        }
+        
+        # Overall metrics (uniform average, matching model.score)
+        train_score = model.score(X_train, y_train)
+        mse = skill_mse.mean()
+        r2 = skill_r2.mean()
+        test_score = r2
         
         # Feature importance
         feature_importance = dict(zip(
@@ -288,7 +341,7 @@ class ModelTrainer:
         
         # Save model
         model_path = os.path.join(self.model_save_dir, "skill_analyzer.joblib")
-        joblib.dump(model, model_path)
+        joblib.dump(model, model_path, compress=MODEL_COMPRESSION)
         
         training_results = {
             "model_type": "skill_analyzer",
@@ -312,65 +365,201 @@ class ModelTrainer:
         
         return training_results
     
-    def _dataframe_to_matches(self, df: pd.DataFrame) -> List[Match]:
-        """Convert DataFrame to Match objects for feature pipeline."""
-        matches = []
-
-        for _, row in df.iterrows():
-            # Create a mock Match object with the required attributes
-            match = type('Match', (), {})()
-
-            # Set basic attributes from DataFrame
-            match.id = row.get('match_id', f"synthetic_{len(matches)}")
-            match.user_id = row['user_id']
-            match.goals = int(row['goals'])
-            match.assists = int(row['assists'])
-            match.saves = int(row['saves'])
-            match.shots = int(row['shots'])
-            match.score = int(row['score'])
-            match.match_duration_minutes = float(row['match_duration_minutes'])
-            match.is_win = bool(row['is_win'])
-            match.result = row['result']
-            match.match_date = row['match_date']
-            match.playlist = row.get('playlist', 'ranked_2v2')
-            match.processed = True
-
-            # Add missing attributes that the feature extractor expects
-            # Team scores (estimate based on result and individual performance)
-            if match.result == 'win':
-                match.score_team_0 = max(3, match.goals + 2)  # Winning team score
-                match.score_team_1 = max(0, match.score_team_0 - 2)  # Losing team score
-            elif match.result == 'loss':
-                match.score_team_1 = max(3, 4)  # Opponent team score
-                match.score_team_0 = max(0, match.score_team_1 - 2)  # Player's team score
-            else:  # draw
-                match.score_team_0 = 2
-                match.score_team_1 = 2
-
-            # Advanced stats (synthetic values based on skill levels if available)
-            profile_data = row.get('_player_profile', {})
-            skill_levels = row.get('_true_skills', {})
-
-            # Boost usage (0-100, based on boost management skill)
-            boost_skill = skill_levels.get('boost_management', 0.5)
-            match.boost_usage = 50 + (boost_skill - 0.5) * 40  # 30-70 range
-
-            # Speed (based on mechanical skill)
-            mechanical_skill = skill_levels.get('mechanical', 0.5)
-            match.average_speed = 800 + (mechanical_skill - 0.5) * 400  # 600-1000 range
-
-            # Time distribution (based on aerial ability)
-            aerial_skill = skill_levels.get('aerial_ability', 0.5)
-            total_seconds = match.match_duration_minutes * 60
-
-            # Higher aerial skill = more time in air
-            air_time_ratio = 0.1 + aerial_skill * 0.3  # 10-40% in air
-            ground_time_ratio = 1.0 - air_time_ratio
-
-            match.time_on_ground = ground_time_ratio * total_seconds
-            match.time_low_air = air_time_ratio * 0.7 * total_seconds  # 70% of air time is low
-            match.time_high_air = air_time_ratio * 0.3 * total_seconds  # 30% of air time is high
-
-            matches.append(match)
-
-        return matches
+    def train_all(self,
+                  features_df: pd.DataFrame,
+                  labels_dict: Dict[str, np.ndarray],
+                  optimize_hyperparams: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Train the weakness detector and skill analyzer, in parallel when CPUs allow."""
+        cpu_count = os.cpu_count() or 1
+        if cpu_count < 4:
+            return {
+                "weakness_detector": self.train_weakness_detector(
+                    features_df, labels_dict, optimize_hyperparams
+                ),
+                "skill_analyzer": self.train_skill_analyzer(
+                    features_df, labels_dict, optimize_hyperparams
+                )
+            }
+
+        # Fit the shared feature pipeline once so both models train on identical features
+        matches = self._dataframe_to_matches(features_df)
+        y_encoded = self._encode_weakness_labels(labels_dict["primary_weakness"], fit=True)
+        X = self.feature_pipeline.fit_transform(matches, target_labels=y_encoded)
+        train_idx, _ = self._get_split_indices(labels_dict["primary_weakness"])
+        X = self._bin_features(X, fit_rows=train_idx)
+
+        n_jobs = cpu_count // 2
+        logger.info("Training models in parallel", workers=2, n_jobs_per_worker=n_jobs)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = {
+                model_name: executor.submit(
+                    _run_trainer, self, model_name, X, labels_dict, optimize_hyperparams, n_jobs
+                )
+                for model_name in ("weakness_detector", "skill_analyzer")
+            }
+            return {model_name: future.result() for model_name, future in futures.items()}
+
+    def _encode_weakness_labels(self, y: np.ndarray, fit: bool) -> np.ndarray:
+        """Encode weakness labels as compact integer codes via pd.Categorical."""
+        if fit:
+            categorical = pd.Categorical(y)
+            self.label_encoder.classes_ = np.asarray(categorical.categories)
+        else:
+            categorical = pd.Categorical(y, categories=self.label_encoder.classes_)
+        return categorical.codes
+
+    def _bin_features(self, X: np.ndarray, fit_rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Quantize features to uint8 bin indices so tree splits sort far fewer values.
+
+        When fit_rows is given the bin edges are first fitted on those rows
+        (the training split), so test rows don't shape the quantiles.
+        """
+        if fit_rows is not None:
+            self.feature_binner.fit(X[fit_rows])
+        return self.feature_binner.transform(X).astype(np.uint8)
+
+    def _resolve_params(self, config: Dict[str, Any], n_jobs: Optional[int]) -> Dict[str, Any]:
+        """Get model parameters, applying an optional n_jobs override."""
+        params = dict(config["params"])
+        if n_jobs is not None:
+            params["n_jobs"] = n_jobs
+        return params
+
+    def _get_split_indices(self, stratify_labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get stratified train/test indices, computed once per set of labels."""
+        n_samples = len(stratify_labels)
+        # hash_array hashes object arrays by value, unlike tobytes()
+        cache_key = hashlib.sha1(
+            pd.util.hash_array(np.asarray(stratify_labels)).tobytes()
+        ).digest()
+        if cache_key not in self._split_indices:
+            splitter = StratifiedShuffleSplit(
+                n_splits=1,
+                test_size=ml_config.test_size,
+                random_state=ml_config.random_state
+            )
+            self._split_indices[cache_key] = next(
+                splitter.split(np.zeros(n_samples), stratify_labels)
+            )
+        return self._split_indices[cache_key]
+
+    def _dataframe_to_matches(self, df: pd.DataFrame) -> List["SyntheticMatch"]:
+        """Convert DataFrame to Match-like views for feature pipeline."""
+        records = self._dataframe_to_match_records(df)
+        return [SyntheticMatch(records, i) for i in range(len(records))]
+
+    def _dataframe_to_match_records(self, df: pd.DataFrame) -> np.ndarray:
+        """Build one structured array holding every derived match attribute."""
+        n = len(df)
+        records = np.empty(n, dtype=MATCH_RECORD_DTYPE)
+
+        # Set basic attributes from DataFrame
+        if 'match_id' in df.columns:
+            records['id'] = df['match_id'].to_numpy()
+        else:
+            records['id'] = [f"synthetic_{i}" for i in range(n)]
+        records['user_id'] = df['user_id'].to_numpy()
+        records['goals'] = df['goals'].to_numpy()
+        records['assists'] = df['assists'].to_numpy()
+        records['saves'] = df['saves'].to_numpy()
+        records['shots'] = df['shots'].to_numpy()
+        records['score'] = df['score'].to_numpy()
+        records['match_duration_minutes'] = df['match_duration_minutes'].to_numpy()
+        records['is_win'] = df['is_win'].to_numpy()
+        records['result'] = df['result'].to_numpy()
+        # astype(object) keeps Timestamps; datetime64[ns] would decay to ints here
+        records['match_date'] = df['match_date'].astype(object).to_numpy()
+        records['playlist'] = (
+            df['playlist'].to_numpy() if 'playlist' in df.columns else 'ranked_2v2'
+        )
+        records['processed'] = True
+
+        # Team scores (estimate based on result and individual performance)
+        result = records['result']
+        is_win_result = result == 'win'
+        is_loss_result = result == 'loss'
+        winning_score = np.maximum(3, records['goals'] + 2)
+        records['score_team_0'] = np.where(is_win_result, winning_score, 2)
+        records['score_team_1'] = np.where(is_win_result, np.maximum(0, winning_score - 2),
+                                           np.where(is_loss_result, 4, 2))
+
+        # Advanced stats (synthetic values based on skill levels if available)
+        def skill_column(skill: str) -> np.ndarray:
+            column = f'_true_{skill}'
+            if column not in df.columns:
+                return np.full(n, 0.5)
+            return df[column].to_numpy(dtype=float)
+
+        # Boost usage (30-70 range, based on boost management skill)
+        records['boost_usage'] = 50 + (skill_column('boost_management') - 0.5) * 40
+
+        # Speed (600-1000 range, based on mechanical skill)
+        records['average_speed'] = 800 + (skill_column('mechanical') - 0.5) * 400
+
+        # Time distribution: higher aerial skill = more time in air (10-40%)
+        air_time_ratio = 0.1 + skill_column('aerial_ability') * 0.3
+        total_seconds = records['match_duration_minutes'] * 60
+        records['time_on_ground'] = (1.0 - air_time_ratio) * total_seconds
+        records['time_low_air'] = air_time_ratio * 0.7 * total_seconds  # 70% of air time is low
+        records['time_high_air'] = air_time_ratio * 0.3 * total_seconds  # 30% of air time is high
+
+        return records
+
+
+def _run_trainer(trainer: ModelTrainer,
+                 model_name: str,
+                 X: np.ndarray,
+                 labels_dict: Dict[str, np.ndarray],
+                 optimize_hyperparams: bool,
+                 n_jobs: int) -> Dict[str, Any]:
+    """Run a single model trainer inside a worker process."""
+    # Keep joblib in this worker from claiming the CPUs of the other one
+    os.environ["LOKY_MAX_CPU_COUNT"] = str(n_jobs)
+    train = getattr(trainer, f"train_{model_name}")
+    return train(None, labels_dict, optimize_hyperparams, X=X, n_jobs=n_jobs)
+
+
+# Attributes the feature extractor reads from a match, stored column-wise
+MATCH_RECORD_DTYPE = np.dtype([
+    ('id', 'O'),
+    ('user_id', 'O'),
+    ('goals', 'i4'),
+    ('assists', 'i4'),
+    ('saves', 'i4'),
+    ('shots', 'i4'),
+    ('score', 'i4'),
+    ('match_duration_minutes', 'f8'),
+    ('is_win', '?'),
+    ('result', 'U4'),
+    ('match_date', 'O'),
+    ('playlist', 'O'),
+    ('processed', '?'),
+    ('score_team_0', 'i4'),
+    ('score_team_1', 'i4'),
+    ('boost_usage', 'f8'),
+    ('average_speed', 'f8'),
+    ('time_on_ground', 'f8'),
+    ('time_low_air', 'f8'),
+    ('time_high_air', 'f8'),
+])
+
+
+class SyntheticMatch:
+    """Lightweight Match stand-in that reads one row of a shared record array."""
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records: np.ndarray, index: int):
+        self._records = records
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            value = self._records[name][self._index]
+        except ValueError:
+            raise AttributeError(name) from None
+        # Plain int/float/str/bool, like the ORM Match the extractor expects
+        return value.item() if isinstance(value, np.generic) else value
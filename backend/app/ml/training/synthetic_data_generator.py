@@ -8,7 +8,7 @@ realistic statistics, skill distributions, and correlations.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from datetime import datetime, timedelta
 import uuid
 import structlog
@@ -39,31 +39,61 @@ class RankTier(Enum):
         self.max_skill = max_skill
 
 
+# Skill categories, in the column order used by every skill array
+SKILL_CATEGORIES = (
+    "mechanical", "positioning", "game_sense", "boost_management",
+    "rotation", "aerial_ability", "shooting", "defending"
+)
+SKILL_INDEX = {category: i for i, category in enumerate(SKILL_CATEGORIES)}
+
+
 @dataclass
 class PlayerProfile:
     """Synthetic player profile with skill characteristics."""
+    # Declared manually since dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "user_id", "username", "rank_tier", "skill_levels",
+        "playstyle", "consistency", "improvement_rate"
+    )
+    
     user_id: str
     username: str
     rank_tier: RankTier
-    skill_levels: Dict[str, float]  # 0-1 scale for each skill category
+    skill_levels: np.ndarray  # 0-1 scale for each skill category, ordered as SKILL_CATEGORIES
     playstyle: str  # "aggressive", "defensive", "balanced"
     consistency: float  # 0-1, affects variance in performance
     improvement_rate: float  # How quickly skills improve over time
 
 
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+# Bit generators accepted by SyntheticDataGenerator
+SUPPORTED_BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "SFC64": np.random.SFC64
+}
+
+
 class SyntheticDataGenerator:
     """Generates synthetic Rocket League training data."""
     
-    def __init__(self, random_seed: Optional[int] = None):
-        """Initialize the synthetic data generator."""
+    def __init__(self, random_seed: Optional[int] = None, bit_generator: str = "PCG64"):
+        """
+        Initialize the synthetic data generator.
+
+        Args:
+            random_seed: Seed for reproducible data generation
+            bit_generator: NumPy bit generator to use ('PCG64' or 'SFC64';
+                SFC64 is fastest for large batched draws)
+        """
+        if bit_generator not in SUPPORTED_BIT_GENERATORS:
+            raise ValueError(f"Unsupported bit generator: {bit_generator}")
+        
         self.random_seed = random_seed or ml_config.random_state
-        np.random.seed(self.random_seed)
+        self.rng = np.random.Generator(SUPPORTED_BIT_GENERATORS[bit_generator](self.random_seed))
         
         # Skill categories and their correlations
-        self.skill_categories = [
-            "mechanical", "positioning", "game_sense", "boost_management",
-            "rotation", "aerial_ability", "shooting", "defending"
-        ]
+        self.skill_categories = list(SKILL_CATEGORIES)
         
         # Define skill correlations (some skills are related)
         self.skill_correlations = {
@@ -88,107 +118,168 @@ class SyntheticDataGenerator:
             "balanced": {skill: 1.0 for skill in self.skill_categories}
         }
         
+        # Playstyle modifiers as a (num_playstyles, num_skills) lookup table
+        self._playstyle_names = np.array(list(self.playstyle_modifiers))
+        self._playstyle_mod_matrix = np.array([
+            [self.playstyle_modifiers[playstyle].get(category, 1.0) for category in self.skill_categories]
+            for playstyle in self._playstyle_names
+        ])
+        self._playstyle_weights = np.array([0.3, 0.3, 0.4])
+        
+        # Correlation pulls as one (num_skills, num_skills) linear operator
+        self._correlation_transform = self._build_correlation_transform(correlation_strength=0.3)
+        
+        # Per-match stat rates as linear combinations of skills: (weights, scale)
+        rate_formulas = {
+            "goals": ({"shooting": 0.7, "mechanical": 0.3}, 1.5),
+            "shots": ({"shooting": 0.6, "mechanical": 0.4}, 8.0),
+            "saves": ({"defending": 0.8, "positioning": 0.2}, 3.0),
+            "assists": ({"game_sense": 0.6, "positioning": 0.4}, 1.2)
+        }
+        self._rate_stats = list(rate_formulas)
+        self._rate_weights = np.array([
+            [weights.get(category, 0.0) * scale for weights, scale in rate_formulas.values()]
+            for category in self.skill_categories
+        ])  # Shape: (num_skills, num_rate_stats)
+        
+        # Rank tier lookup tables (weighted towards middle ranks)
+        self._rank_tiers = list(RankTier)
+        self._tier_mins = np.array([tier.min_skill for tier in self._rank_tiers])
+        self._tier_maxs = np.array([tier.max_skill for tier in self._rank_tiers])
+        self._tier_weights = np.array([0.05, 0.1, 0.15, 0.25, 0.25, 0.15, 0.04, 0.01])
+        
         logger.info("SyntheticDataGenerator initialized", 
                    seed=self.random_seed,
+                   bit_generator=bit_generator,
                    skill_categories=len(self.skill_categories))
     
     def generate_player_profiles(self, num_players: int = 1000) -> List[PlayerProfile]:
         """Generate synthetic player profiles with diverse characteristics."""
-        profiles = []
-        
-        for i in range(num_players):
-            # Select rank tier (weighted towards middle ranks)
-            rank_weights = [0.05, 0.1, 0.15, 0.25, 0.25, 0.15, 0.04, 0.01]
-            rank_tier = np.random.choice(list(RankTier), p=rank_weights)
-            
-            # Generate base skill level within rank range
-            base_skill = np.random.uniform(rank_tier.min_skill, rank_tier.max_skill)
-            
-            # Select playstyle
-            playstyle = np.random.choice(["aggressive", "defensive", "balanced"], 
-                                       p=[0.3, 0.3, 0.4])
-            
-            # Generate skill levels with correlations
-            skill_levels = self._generate_correlated_skills(base_skill, playstyle)
-            
-            # Generate player characteristics
-            consistency = np.random.beta(2, 2)  # Most players have moderate consistency
-            improvement_rate = np.random.exponential(0.02)  # Small positive improvement
-            
-            profile = PlayerProfile(
+        # Select rank tiers
+        tier_indices = self.rng.choice(len(self._rank_tiers), size=num_players, p=self._tier_weights)
+        
+        # Generate base skill levels within rank ranges
+        base_skills = self.rng.uniform(self._tier_mins[tier_indices], self._tier_maxs[tier_indices])
+        
+        # Select playstyles
+        playstyle_ids = self.rng.choice(
+            len(self._playstyle_names), size=num_players, p=self._playstyle_weights
+        )
+        playstyles = self._playstyle_names[playstyle_ids]
+        
+        # Generate player characteristics
+        consistencies = self.rng.beta(2, 2, size=num_players)  # Most players have moderate consistency
+        improvement_rates = self.rng.exponential(0.02, size=num_players)  # Small positive improvement
+        
+        # Generate skill levels with correlations
+        skill_matrix = self._generate_correlated_skills(base_skills, playstyle_ids)
+        
+        profiles = [
+            PlayerProfile(
                 user_id=str(uuid.uuid4()),
                 username=f"player_{i:04d}",
-                rank_tier=rank_tier,
-                skill_levels=skill_levels,
-                playstyle=playstyle,
-                consistency=consistency,
-                improvement_rate=improvement_rate
+                rank_tier=self._rank_tiers[tier_indices[i]],
+                skill_levels=skill_matrix[i],
+                playstyle=str(playstyles[i]),
+                consistency=float(consistencies[i]),
+                improvement_rate=float(improvement_rates[i])
             )
-            
-            profiles.append(profile)
+            for i in range(num_players)
+        ]
         
         logger.info("Generated player profiles", count=len(profiles))
         return profiles
     
-    def _generate_correlated_skills(self, base_skill: float, playstyle: str) -> Dict[str, float]:
-        """Generate skill levels with realistic correlations."""
-        skills = {}
-        
-        # Start with base skill level
-        for category in self.skill_categories:
-            # Add some random variation
-            variation = np.random.normal(0, 0.1)
-            skill_level = np.clip(base_skill + variation, 0.0, 1.0)
-            
-            # Apply playstyle modifiers
-            modifier = self.playstyle_modifiers[playstyle].get(category, 1.0)
-            skill_level *= modifier
-            
-            skills[category] = np.clip(skill_level, 0.0, 1.0)
+    def _generate_correlated_skills(self,
+                                   base_skills: np.ndarray,
+                                   playstyle_ids: np.ndarray) -> np.ndarray:
+        """
+        Generate skill levels with realistic correlations for a batch of players.
+
+        Args:
+            base_skills: Base skill level per player
+            playstyle_ids: Index into self._playstyle_names per player
+
+        Returns:
+            Matrix of shape (num_players, num_skills), columns ordered as
+            self.skill_categories
+        """
+        num_players = len(base_skills)
+        num_skills = len(self.skill_categories)
+        
+        # Start with base skill level plus some random variation
+        skills = base_skills[:, None] + self.rng.normal(0, 0.1, size=(num_players, num_skills))
+        np.clip(skills, 0.0, 1.0, out=skills)
+        
+        # Apply playstyle modifiers
+        skills *= self._playstyle_mod_matrix[playstyle_ids]
+        np.clip(skills, 0.0, 1.0, out=skills)
         
         # Apply correlations (correlated skills should be similar)
+        return skills @ self._correlation_transform
+    
+    def _build_correlation_transform(self, correlation_strength: float) -> np.ndarray:
+        """
+        Build the linear operator that applies every skill correlation pull.
+
+        Each pull moves a correlated skill towards its base skill, in the
+        order of self.skill_correlations. Every pull is linear and keeps
+        values within [0, 1], so the whole sequence composes exactly into
+        one matrix: skills @ transform.
+        """
+        num_skills = len(self.skill_categories)
+        
+        transform = np.eye(num_skills)
         for skill, correlated_skills in self.skill_correlations.items():
-            if skill in skills:
-                base_level = skills[skill]
-                for corr_skill in correlated_skills:
-                    if corr_skill in skills:
-                        # Pull correlated skill towards base skill
-                        correlation_strength = 0.3
-                        current_level = skills[corr_skill]
-                        adjusted_level = (current_level * (1 - correlation_strength) + 
-                                        base_level * correlation_strength)
-                        skills[corr_skill] = np.clip(adjusted_level, 0.0, 1.0)
-        
-        return skills
+            for corr_skill in correlated_skills:
+                # Pull correlated skill towards base skill
+                pull = np.eye(num_skills)
+                pull[SKILL_INDEX[corr_skill], SKILL_INDEX[corr_skill]] = 1 - correlation_strength
+                pull[SKILL_INDEX[skill], SKILL_INDEX[corr_skill]] = correlation_strength
+                transform = transform @ pull
+        
+        return transform
     
     def generate_match_data(self, 
                           player_profile: PlayerProfile,
                           num_matches: int = 50,
                           time_span_days: int = 30) -> List[Dict[str, Any]]:
         """Generate synthetic match data for a player."""
-        matches = []
-        
         # Generate matches over time span
         start_date = datetime.now() - timedelta(days=time_span_days)
         
-        for i in range(num_matches):
-            # Match timing (more matches on weekends)
-            days_offset = np.random.uniform(0, time_span_days)
-            match_date = start_date + timedelta(days=days_offset)
-            
-            # Apply skill improvement over time
-            time_progress = days_offset / time_span_days
-            skill_improvement = player_profile.improvement_rate * time_progress
-            
-            # Generate match performance based on skills
-            match_stats = self._generate_match_performance(
-                player_profile, skill_improvement, match_date
-            )
-            
-            matches.append(match_stats)
+        # Match timing, drawn already sorted by date
+        days_offsets = np.sort(self.rng.uniform(0, time_span_days, size=num_matches))
+        
+        # Apply skill improvement over time
+        skill_improvements = player_profile.improvement_rate * days_offsets / time_span_days
+        current_skills = np.minimum(
+            1.0, player_profile.skill_levels[None, :] + skill_improvements[:, None]
+        )
         
-        # Sort by date
-        matches.sort(key=lambda x: x['match_date'])
+        # Generate match performance based on skills
+        stats = self._generate_match_performance(
+            current_skills, player_profile.consistency, player_profile.playstyle
+        )
+        columns = {stat: values.tolist() for stat, values in stats.items()}
+        match_dates = self._offset_dates(start_date, days_offsets).tolist()
+        
+        # Store true skill levels for training labels
+        true_skill_keys = [f"_true_{category}" for category in self.skill_categories]
+        
+        matches = [
+            {
+                "user_id": player_profile.user_id,
+                "match_date": match_dates[i],
+                **{stat: values[i] for stat, values in columns.items()},
+                "processed": True,
+                **dict(zip(true_skill_keys, current_skills[i].tolist())),
+                "_rank_tier": player_profile.rank_tier.display_name,
+                "_playstyle": player_profile.playstyle,
+                "_consistency": player_profile.consistency
+            }
+            for i in range(num_matches)
+        ]
         
         logger.debug("Generated match data", 
                     player=player_profile.username,
@@ -196,71 +287,70 @@ class SyntheticDataGenerator:
         
         return matches
     
+    def _offset_dates(self, start_date: datetime, days_offsets: np.ndarray) -> np.ndarray:
+        """Offset a start date by fractional days as one datetime64[us] array."""
+        offsets_us = (days_offsets * MICROSECONDS_PER_DAY).astype(np.int64)
+        return np.datetime64(start_date, "us") + offsets_us.astype("timedelta64[us]")
+    
     def _generate_match_performance(self, 
-                                  profile: PlayerProfile,
-                                  skill_improvement: float,
-                                  match_date: datetime) -> Dict[str, Any]:
-        """Generate realistic match performance statistics."""
-        # Apply consistency factor (affects performance variance)
-        consistency_factor = profile.consistency
-        performance_variance = (1 - consistency_factor) * 0.3
-        
-        # Current skill levels with improvement
-        current_skills = {
-            skill: min(1.0, level + skill_improvement)
-            for skill, level in profile.skill_levels.items()
-        }
-        
-        # Generate core statistics based on skills
-        mechanical_skill = current_skills["mechanical"]
-        shooting_skill = current_skills["shooting"]
-        defending_skill = current_skills["defending"]
-        positioning_skill = current_skills["positioning"]
+                                  current_skills: np.ndarray,
+                                  consistency: Union[float, np.ndarray],
+                                  playstyle: Union[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Generate realistic match performance statistics for a batch of matches.
+
+        Args:
+            current_skills: Skill levels per match, shape (num_matches, num_skills)
+            consistency: Player consistency, scalar or per match
+            playstyle: Player playstyle, scalar or per match
+
+        Returns:
+            Dict of per-match statistic arrays
+        """
+        num_matches = len(current_skills)
         
-        # Add performance variance
-        def add_variance(base_value: float) -> float:
-            variance = np.random.normal(0, performance_variance)
-            return max(0, base_value + variance)
+        # Apply consistency factor (affects performance variance)
+        performance_variance = (1 - np.asarray(consistency)) * 0.3
         
         # Generate match statistics
-        match_duration = np.random.uniform(4.5, 7.0)  # minutes
+        match_duration = self.rng.uniform(4.5, 7.0, size=num_matches)  # minutes
         
-        # Goals (based on shooting and mechanical skills)
-        goals_rate = (shooting_skill * 0.7 + mechanical_skill * 0.3) * 1.5
-        goals = int(np.random.poisson(add_variance(goals_rate)))
+        # Base stat rates from skills in a single matmul -> (num_matches, num_rate_stats):
+        # goals (shooting, mechanical), shots (shooting, mechanical),
+        # saves (defending, positioning), assists (game sense, positioning)
+        rates = current_skills @ self._rate_weights
         
-        # Shots (higher for aggressive players)
-        shots_multiplier = 1.2 if profile.playstyle == "aggressive" else 1.0
-        shots_rate = (shooting_skill * 0.6 + mechanical_skill * 0.4) * 8 * shots_multiplier
-        shots = max(goals, int(np.random.poisson(add_variance(shots_rate))))
+        # Shots are higher for aggressive players
+        rates[:, self._rate_stats.index("shots")] *= np.where(
+            np.asarray(playstyle) == "aggressive", 1.2, 1.0
+        )
         
-        # Saves (based on defending and positioning)
-        saves_rate = (defending_skill * 0.8 + positioning_skill * 0.2) * 3
-        saves = int(np.random.poisson(add_variance(saves_rate)))
+        # Add performance variance to every rate with one noise draw
+        noise_scale = np.broadcast_to(performance_variance, (num_matches,))[:, None]
+        rates += self.rng.normal(0, noise_scale, size=rates.shape)
+        np.maximum(rates, 0, out=rates)
         
-        # Assists (based on game sense and positioning)
-        assists_rate = (current_skills["game_sense"] * 0.6 + positioning_skill * 0.4) * 1.2
-        assists = int(np.random.poisson(add_variance(assists_rate)))
+        # Draw all counting stats with one Poisson call
+        goals, shots, saves, assists = self.rng.poisson(rates).T
+        shots = np.maximum(goals, shots)
         
-        # Score (combination of all actions)
+        # Score (combination of all actions plus random bonus points)
         base_score = goals * 100 + assists * 50 + saves * 50 + shots * 10
-        score_bonus = int(np.random.uniform(0, 200))  # Random bonus points
+        score_bonus = self.rng.uniform(0, 200, size=num_matches).astype(int)
         score = base_score + score_bonus
         
-        # Win probability based on overall skill
-        overall_skill = np.mean(list(current_skills.values()))
-        win_probability = 0.3 + (overall_skill * 0.4)  # 30-70% win rate range
-        is_win = np.random.random() < win_probability
+        # Win probability based on overall skill (30-70% win rate range)
+        overall_skill = current_skills.mean(axis=1)
+        win_probability = 0.3 + (overall_skill * 0.4)
+        is_win = self.rng.random(num_matches) < win_probability
         
         # Match result
-        if is_win:
-            result = "win"
-        else:
-            result = "loss" if np.random.random() < 0.8 else "draw"
+        is_loss = self.rng.random(num_matches) < 0.8
+        result = np.where(is_win, "win", np.where(is_loss, "loss", "draw"))
+        
+        playlists = np.array(["ranked_2v2", "ranked_3v3", "casual_2v2", "casual_3v3"])
         
         return {
-            "user_id": profile.user_id,
-            "match_date": match_date,
             "goals": goals,
             "assists": assists,
             "saves": saves,
@@ -269,15 +359,7 @@ class SyntheticDataGenerator:
             "match_duration_minutes": match_duration,
             "is_win": is_win,
             "result": result,
-            "playlist": np.random.choice(["ranked_2v2", "ranked_3v3", "casual_2v2", "casual_3v3"]),
-            "processed": True,
-            # Store true skill levels for training labels
-            "_true_skills": current_skills,
-            "_player_profile": {
-                "rank_tier": profile.rank_tier.display_name,
-                "playstyle": profile.playstyle,
-                "consistency": profile.consistency
-            }
+            "playlist": playlists[self.rng.integers(len(playlists), size=num_matches)]
         }
 
     def create_training_dataset(self,
@@ -301,58 +383,93 @@ class SyntheticDataGenerator:
         # Generate player profiles
         profiles = self.generate_player_profiles(num_players)
 
-        # Generate match data for all players
-        all_matches = []
-        all_labels = {
-            "primary_weakness": [],
-            "skill_scores": [],
-            "weakness_confidence": [],
-            "player_ids": []
-        }
+        # Generate match data for all players in one batch
+        features_df = self._generate_dataset_matches(profiles, matches_per_player)
 
-        for profile in profiles:
-            # Generate matches for this player
-            matches = self.generate_match_data(profile, matches_per_player)
-            all_matches.extend(matches)
+        # Create training labels based on true skills
+        skill_matrix = np.stack([profile.skill_levels for profile in profiles])
+        primary_weaknesses = self._identify_primary_weakness(skill_matrix)
 
-            # Create training labels based on true skills
-            primary_weakness = self._identify_primary_weakness(profile.skill_levels)
-            skill_scores = list(profile.skill_levels.values())
+        # Confidence based on skill variance (more varied skills = lower confidence)
+        confidences = np.maximum(0.1, 1.0 - skill_matrix.var(axis=1) * 2)
 
-            # Confidence based on skill variance (more varied skills = lower confidence)
-            skill_variance = np.var(skill_scores)
-            confidence = max(0.1, 1.0 - skill_variance * 2)
-
-            # Add labels for each match (same player = same labels)
-            for _ in matches:
-                all_labels["primary_weakness"].append(primary_weakness)
-                all_labels["skill_scores"].append(skill_scores)
-                all_labels["weakness_confidence"].append(confidence)
-                all_labels["player_ids"].append(profile.user_id)
-
-        # Convert to DataFrame
-        features_df = pd.DataFrame(all_matches)
-
-        # Convert labels to numpy arrays
+        # Repeat labels for each match (same player = same labels)
         labels_dict = {
-            "primary_weakness": np.array(all_labels["primary_weakness"]),
-            "skill_scores": np.array(all_labels["skill_scores"]),
-            "weakness_confidence": np.array(all_labels["weakness_confidence"]),
-            "player_ids": np.array(all_labels["player_ids"])
+            "primary_weakness": np.repeat(primary_weaknesses, matches_per_player),
+            "skill_scores": np.repeat(skill_matrix, matches_per_player, axis=0),
+            "weakness_confidence": np.repeat(confidences, matches_per_player),
+            "player_ids": np.repeat([profile.user_id for profile in profiles], matches_per_player)
         }
 
         logger.info("Training dataset created",
                    total_matches=len(features_df),
-                   unique_players=len(set(all_labels["player_ids"])),
+                   unique_players=len(profiles),
                    features=len(features_df.columns))
 
         return features_df, labels_dict
 
-    def _identify_primary_weakness(self, skill_levels: Dict[str, float]) -> str:
-        """Identify the primary weakness (lowest skill) for a player."""
-        # Find the skill with the lowest score
-        min_skill = min(skill_levels.items(), key=lambda x: x[1])
-        return min_skill[0]
+    def _generate_dataset_matches(self,
+                                  profiles: List[PlayerProfile],
+                                  matches_per_player: int,
+                                  time_span_days: int = 30) -> pd.DataFrame:
+        """Generate matches for every player with one (players, matches) grid of draws."""
+        num_players = len(profiles)
+        start_date = datetime.now() - timedelta(days=time_span_days)
+
+        skill_matrix = np.stack([profile.skill_levels for profile in profiles])
+        improvement_rates = np.array([profile.improvement_rate for profile in profiles])
+        consistencies = np.array([profile.consistency for profile in profiles])
+        playstyles = np.array([profile.playstyle for profile in profiles])
+
+        # Match timing per player, drawn already sorted by date
+        days_offsets = np.sort(
+            self.rng.uniform(0, time_span_days, size=(num_players, matches_per_player)), axis=1
+        )
+
+        # Apply skill improvement over time -> (players, matches, skills)
+        skill_improvements = improvement_rates[:, None] * days_offsets / time_span_days
+        current_skills = np.minimum(
+            1.0, skill_matrix[:, None, :] + skill_improvements[:, :, None]
+        ).reshape(-1, len(self.skill_categories))
+
+        # Generate match performance for all players x matches at once
+        stats = self._generate_match_performance(
+            current_skills,
+            np.repeat(consistencies, matches_per_player),
+            np.repeat(playstyles, matches_per_player)
+        )
+
+        return pd.DataFrame({
+            "user_id": np.repeat([profile.user_id for profile in profiles], matches_per_player),
+            "match_date": self._offset_dates(start_date, days_offsets.ravel()),
+            **stats,
+            "processed": True,
+            # Store true skill levels for training labels, one numeric column per skill
+            **{
+                f"_true_{category}": current_skills[:, i]
+                for i, category in enumerate(self.skill_categories)
+            },
+            "_rank_tier": np.repeat(
+                [profile.rank_tier.display_name for profile in profiles], matches_per_player
+            ),
+            "_playstyle": np.repeat(playstyles, matches_per_player),
+            "_consistency": np.repeat(consistencies, matches_per_player)
+        })
+
+    def _identify_primary_weakness(self, skill_array: np.ndarray) -> Union[str, np.ndarray]:
+        """
+        Identify the primary weakness (lowest skill).
+
+        Args:
+            skill_array: Skill levels ordered as self.skill_categories, either
+                one player's (num_skills,) vector or a (num_players, num_skills) matrix
+
+        Returns:
+            The weakest skill name, or an array of names for a matrix input
+        """
+        if skill_array.ndim == 1:
+            return self.skill_categories[int(np.argmin(skill_array))]
+        return np.take(np.array(self.skill_categories), skill_array.argmin(axis=1))
 
     def save_training_data(self,
                           features_df: pd.DataFrame,
@@ -363,16 +480,17 @@ class SyntheticDataGenerator:
 
         os.makedirs(output_dir, exist_ok=True)
 
-        # Save features
-        features_path = os.path.join(output_dir, "training_features.csv")
-        features_df.to_csv(features_path, index=False)
+        # Save features (binary columnar format keeps dtypes and skips text formatting)
+        features_path = os.path.join(output_dir, "training_features.parquet")
+        features_df.to_parquet(features_path, engine="pyarrow", compression="snappy", index=False)
 
         # Save labels
         labels_path = os.path.join(output_dir, "training_labels.npz")
-        np.savez(labels_path, **labels_dict)
+        np.savez_compressed(labels_path, **labels_dict)
 
         # Save metadata
         metadata = {
+            "format": "parquet",
             "num_samples": len(features_df),
             "num_features": len(features_df.columns),
             "skill_categories": self.skill_categories,
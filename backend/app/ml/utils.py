@@ -8,18 +8,25 @@ data validation, and performance monitoring.
 import os
 import pickle
 import logging
+import joblib
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from sklearn.metrics import classification_report, confusion_matrix
 import structlog
 
 from .config import MLConfig, ml_config
 
 logger = structlog.get_logger(__name__)
 
+# LZ4 keeps model artifacts small on disk while adding negligible CPU cost
+MODEL_COMPRESSION = ("lz4", 3)
+
+# Protocol 2+ pickles written by the old pickle-based ModelManager start with this byte
+PICKLE_MAGIC = b"\x80"
+
 
 class ModelManager:
     """Manages ML model persistence, loading, and versioning."""
@@ -32,8 +39,7 @@ class ModelManager:
         """Save a trained model to disk."""
         try:
             model_path = self.models_dir / f"{model_name}_{version}.pkl"
-            with open(model_path, 'wb') as f:
-                pickle.dump(model, f)
+            joblib.dump(model, model_path, compress=MODEL_COMPRESSION)
             
             logger.info("Model saved successfully", 
                        model_name=model_name, 
@@ -56,7 +62,12 @@ class ModelManager:
                 raise FileNotFoundError(f"Model not found: {model_path}")
             
             with open(model_path, 'rb') as f:
-                model = pickle.load(f)
+                if f.read(1) == PICKLE_MAGIC:
+                    # Legacy uncompressed pickle
+                    f.seek(0)
+                    model = pickle.load(f)
+                else:
+                    model = joblib.load(f)
             
             logger.info("Model loaded successfully", 
                        model_name=model_name, 
@@ -72,19 +83,24 @@ class ModelManager:
     def list_models(self) -> List[Dict[str, str]]:
         """List all available models."""
         models = []
-        for model_file in self.models_dir.glob("*.pkl"):
-            name_version = model_file.stem
-            if "_" in name_version:
-                name, version = name_version.rsplit("_", 1)
-            else:
-                name, version = name_version, "unknown"
-            
-            models.append({
-                "name": name,
-                "version": version,
-                "path": str(model_file),
-                "size": model_file.stat().st_size
-            })
+        # DirEntry caches stat info from the directory read, avoiding a syscall per file
+        with os.scandir(self.models_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".pkl") or not entry.is_file():
+                    continue
+                
+                name_version = entry.name[:-len(".pkl")]
+                if "_" in name_version:
+                    name, version = name_version.rsplit("_", 1)
+                else:
+                    name, version = name_version, "unknown"
+                
+                models.append({
+                    "name": name,
+                    "version": version,
+                    "path": entry.path,
+                    "size": entry.stat().st_size
+                })
         
         return models
 
@@ -103,20 +119,25 @@ class DataValidator:
         if missing_columns:
             errors.append(f"Missing required columns: {missing_columns}")
         
+        # Column statistics gathered in one pass per column
+        present_columns = [col for col in required_columns if col in data.columns]
+        column_data = data[present_columns]
+        column_mins = column_data.min()
+        column_nulls = column_data.isnull().any()
+        
         # Check for negative values where they shouldn't exist
         numeric_columns = ['goals', 'assists', 'saves', 'shots', 'score']
-        for col in numeric_columns:
-            if col in data.columns and (data[col] < 0).any():
+        for col in column_mins.index[column_mins < 0]:
+            if col in numeric_columns:
                 errors.append(f"Negative values found in {col}")
         
         # Check for reasonable value ranges
-        if 'score' in data.columns and (data['score'] > 2000).any():
+        if 'score' in present_columns and column_data['score'].max() > 2000:
             errors.append("Unreasonably high scores detected (>2000)")
         
         # Check for missing values in critical columns
-        for col in required_columns:
-            if col in data.columns and data[col].isnull().any():
-                errors.append(f"Missing values found in {col}")
+        for col in column_nulls.index[column_nulls]:
+            errors.append(f"Missing values found in {col}")
         
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -126,12 +147,13 @@ class DataValidator:
         """Validate feature matrix for ML training."""
         errors = []
         
-        # Check for NaN or infinite values
-        if np.isnan(X).any():
-            errors.append("NaN values found in feature matrix")
-        
-        if np.isinf(X).any():
-            errors.append("Infinite values found in feature matrix")
+        # Check for NaN or infinite values; a finite sum rules both out in one pass
+        if not np.isfinite(X.sum()):
+            if np.isnan(X).any():
+                errors.append("NaN values found in feature matrix")
+            
+            if np.isinf(X).any():
+                errors.append("Infinite values found in feature matrix")
         
         # Check feature matrix shape
         if X.shape[0] == 0:
@@ -145,7 +167,7 @@ class DataValidator:
             if len(y) != X.shape[0]:
                 errors.append("Feature matrix and target vector length mismatch")
             
-            if np.isnan(y).any():
+            if not np.isfinite(y.sum()) and np.isnan(y).any():
                 errors.append("NaN values found in target vector")
         
         is_valid = len(errors) == 0
@@ -164,9 +186,9 @@ class PerformanceMonitor:
     ) -> Dict[str, Any]:
         """Log comprehensive model performance metrics."""
         
-        # Calculate metrics
-        accuracy = accuracy_score(y_true, y_pred)
-        report = classification_report(y_true, y_pred, output_dict=True)
+        # Calculate metrics (the report already includes overall accuracy)
+        report = classification_report(y_true, y_pred, output_dict=True, zero_division=0)
+        accuracy = report['accuracy']
         
         metrics = {
             "model_name": model_name,
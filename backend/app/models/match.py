@@ -1,9 +1,8 @@
 """
 Match model for storing Rocket League replay data.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, UUID, Integer, ForeignKey, JSON, Float, Boolean
+from sqlalchemy import Column, String, DateTime, UUID, Integer, ForeignKey, JSON, Float, Boolean, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -15,7 +14,7 @@ class Match(Base):
     
     __tablename__ = "matches"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # External identifiers
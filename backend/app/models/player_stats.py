@@ -1,12 +1,16 @@
 """
 Player statistics model using TimescaleDB for time-series data.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, UUID, Float, ForeignKey, Index
+from types import MappingProxyType
+from typing import Any, Dict, List
+
+from psycopg2.extras import execute_values, register_uuid
+from sqlalchemy import Column, String, DateTime, UUID, BigInteger, Identity, Float, ForeignKey, Index, event, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
+from app.config import settings
 from app.database import Base
 
 
@@ -15,13 +19,15 @@ class PlayerStats(Base):
     
     __tablename__ = "player_stats"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    time = Column(DateTime(timezone=True), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    # TimescaleDB only enforces uniqueness per chunk, so the partitioning
+    # column has to be part of the primary key.
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    time = Column(DateTime(timezone=True), primary_key=True, nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     match_id = Column(UUID(as_uuid=True), ForeignKey("matches.id"), nullable=True, index=True)
     
     # Stat metadata
-    stat_type = Column(String(50), nullable=False, index=True)  # 'aerial_accuracy', 'save_percentage', etc.
+    stat_type = Column(String(50), nullable=False)  # 'aerial_accuracy', 'save_percentage', etc.
     category = Column(String(30), nullable=False)  # 'mechanical', 'positioning', 'game_sense'
     
     # Stat values
@@ -41,19 +47,153 @@ class PlayerStats(Base):
     user = relationship("User")
     match = relationship("Match", back_populates="player_stats")
     
-    # Indexes for time-series queries
+    # Indexes for time-series queries. The leading columns also serve plain
+    # user_id / stat_type filters, so those columns carry no index of their own.
     __table_args__ = (
         Index('idx_player_stats_user_time', 'user_id', 'time'),
         Index('idx_player_stats_type_time', 'stat_type', 'time'),
         Index('idx_player_stats_category_time', 'category', 'time'),
+        # One row per stat per match, so reprocessed matches insert nothing new
+        Index(
+            'uq_player_stats_match_user_stat_time',
+            'match_id', 'user_id', 'stat_type', 'time',
+            unique=True,
+        ),
+        # Covers "user X's values for stat Y over time" with an index-only scan
+        Index(
+            'idx_player_stats_user_stat_time_covering',
+            'user_id', 'stat_type', text('time DESC'),
+            postgresql_include=['value'],
+        ),
     )
     
+    # Columns accepted by bulk_insert; id and created_at are filled by the database
+    BULK_INSERT_COLUMNS = (
+        'time', 'user_id', 'match_id', 'stat_type', 'category', 'value',
+        'rank_percentile', 'improvement_rate', 'confidence_score',
+        'playlist', 'sample_size',
+    )
+
+    @classmethod
+    def bulk_insert(cls, session, rows: List[Dict[str, Any]], page_size: int = 1000) -> int:
+        """Insert many stat rows with multi-row INSERT statements.
+
+        Runs on the session's connection, so the rows are committed together
+        with the rest of the session's transaction. Missing keys insert NULL.
+        Rows already recorded for the same match, user, stat and time are
+        skipped, so reprocessing a match is harmless.
+
+        Returns the number of rows actually inserted.
+        """
+        if not rows:
+            return 0
+
+        columns = cls.BULK_INSERT_COLUMNS
+        values = [tuple(row.get(column) for column in columns) for row in rows]
+        cursor = session.connection().connection.cursor()
+        try:
+            # uuid.UUID support for the raw cursor, set up here rather than
+            # as a side effect of importing the model
+            register_uuid(conn_or_curs=cursor)
+            inserted = execute_values(
+                cursor,
+                f"INSERT INTO {cls.__tablename__} ({', '.join(columns)}) VALUES %s "
+                "ON CONFLICT DO NOTHING RETURNING 1",
+                values,
+                page_size=page_size,
+                fetch=True,
+            )
+        finally:
+            cursor.close()
+        return len(inserted)
+
     def __repr__(self):
         return f"<PlayerStats(user_id={self.user_id}, stat_type={self.stat_type}, value={self.value})>"
 
 
-# Common stat types for reference
-STAT_TYPES = {
+# Daily per-user rollups, kept up to date by TimescaleDB so dashboards read
+# pre-aggregated buckets instead of raw rows. Ordered-set aggregates such as
+# percentile_cont are not allowed in continuous aggregates, hence min/max/stddev.
+PLAYER_STATS_DAILY_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS player_stats_daily
+    WITH (timescaledb.continuous) AS
+    SELECT user_id,
+           stat_type,
+           time_bucket(INTERVAL '1 day', time) AS bucket,
+           avg(value) AS avg_value,
+           min(value) AS min_value,
+           max(value) AS max_value,
+           stddev(value) AS stddev_value,
+           count(*) AS sample_count
+    FROM player_stats
+    GROUP BY user_id, stat_type, bucket
+    WITH NO DATA
+    """,
+    """
+    SELECT add_continuous_aggregate_policy('player_stats_daily',
+        start_offset => INTERVAL '30 days',
+        end_offset => INTERVAL '1 hour',
+        schedule_interval => INTERVAL '15 minutes',
+        if_not_exists => TRUE)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_player_stats_daily_user_stat_bucket
+    ON player_stats_daily (user_id, stat_type, bucket DESC)
+    """,
+)
+
+
+@event.listens_for(PlayerStats.__table__, "after_create")
+def create_player_stats_hypertable(target, connection, **kw):
+    """Convert player_stats into a hypertable partitioned on ``time``.
+
+    TimescaleDB creates its own index on ``time`` for each chunk, so the
+    model does not declare one. Chunks older than the compression window are
+    converted to columnstore, segmented by user and stat type so per-user
+    reads only decompress the segments they need, and chunks past the
+    retention window are dropped.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+    connection.execute(
+        text(
+            "SELECT create_hypertable('player_stats', 'time', "
+            "chunk_time_interval => CAST(:chunk_interval AS INTERVAL), "
+            "if_not_exists => TRUE)"
+        ),
+        {"chunk_interval": settings.timescale_chunk_time_interval},
+    )
+    connection.execute(
+        text(
+            "ALTER TABLE player_stats SET ("
+            "timescaledb.compress, "
+            "timescaledb.compress_segmentby = 'user_id, stat_type', "
+            "timescaledb.compress_orderby = 'time DESC')"
+        )
+    )
+    connection.execute(
+        text(
+            "SELECT add_compression_policy('player_stats', "
+            "CAST(:compress_after AS INTERVAL), if_not_exists => TRUE)"
+        ),
+        {"compress_after": settings.timescale_compress_after},
+    )
+    # Expired chunks are dropped whole instead of deleted row by row
+    connection.execute(
+        text(
+            "SELECT add_retention_policy('player_stats', "
+            "make_interval(days => :retention_days), if_not_exists => TRUE)"
+        ),
+        {"retention_days": settings.player_stats_retention_days},
+    )
+    for statement in PLAYER_STATS_DAILY_DDL:
+        connection.execute(text(statement))
+
+
+# Common stat types for reference (read-only)
+STAT_TYPES = MappingProxyType({
     # Mechanical skills
     'aerial_accuracy': 'mechanical',
     'aerial_frequency': 'mechanical', 
@@ -75,4 +215,4 @@ STAT_TYPES = {
     'ball_prediction': 'game_sense',
     'teammate_awareness': 'game_sense',
     'decision_making': 'game_sense',
-}
+})
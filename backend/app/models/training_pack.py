@@ -1,21 +1,35 @@
 """
 Training pack model for storing Rocket League training packs.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, UUID, Integer, Text, ARRAY, Float, Boolean
+from sqlalchemy import FetchedValue, DDL, event, Column, String, DateTime, UUID, Integer, Text, ARRAY, Float, Boolean, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
 
+# Difficulty labels indexed by the 1-10 difficulty scale
+DIFFICULTY_TEXT = (
+    "Unknown",
+    "Very Easy",
+    "Easy",
+    "Easy-Medium",
+    "Medium",
+    "Medium",
+    "Medium-Hard",
+    "Hard",
+    "Hard",
+    "Very Hard",
+    "Extreme",
+)
+
 
 class TrainingPack(Base):
     """Training pack model representing a Rocket League training pack."""
     
     __tablename__ = "training_packs"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     
     # Basic info
     name = Column(String(255), nullable=False)
@@ -46,32 +60,53 @@ class TrainingPack(Base):
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # set by trigger
     
     # Relationships
     training_sessions = relationship("TrainingSession", back_populates="training_pack")
     
+    # The unique b-tree enforces uniqueness; pack lookups are equality-only
+    __table_args__ = (
+        Index('idx_training_packs_code_hash', 'code', postgresql_using='hash'),
+    )
+    
     def __repr__(self):
         return f"<TrainingPack(code={self.code}, name={self.name}, category={self.category})>"
     
     @property
     def difficulty_text(self) -> str:
         """Get difficulty as text."""
-        difficulty_map = {
-            1: "Very Easy",
-            2: "Easy", 
-            3: "Easy-Medium",
-            4: "Medium",
-            5: "Medium",
-            6: "Medium-Hard",
-            7: "Hard",
-            8: "Hard",
-            9: "Very Hard",
-            10: "Extreme"
-        }
-        return difficulty_map.get(self.difficulty, "Unknown")
+        if self.difficulty is not None and 0 < self.difficulty <= 10:
+            return DIFFICULTY_TEXT[self.difficulty]
+        return "Unknown"
     
     @property
     def average_rating(self) -> float:
         """Get average rating, defaulting to 0 if no ratings."""
         return self.rating or 0.0
+
+
+# Leave room on each page so counter and rating updates, which touch no
+# indexed column, can be done as HOT updates; vacuum more eagerly since
+# this table is updated far more than it is inserted into.
+event.listen(
+    TrainingPack.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE training_packs SET ("
+        "fillfactor = 80, "
+        "autovacuum_vacuum_scale_factor = 0.05, "
+        "autovacuum_analyze_scale_factor = 0.02)"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+# updated_at is maintained by the set_updated_at() trigger (see app.database)
+event.listen(
+    TrainingPack.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER trg_training_packs_updated_at BEFORE UPDATE ON training_packs "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    ).execute_if(dialect="postgresql"),
+)
@@ -1,9 +1,9 @@
 """
 Training session model for tracking user training progress.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, UUID, Integer, Float, ForeignKey, JSON, Boolean
+from sqlalchemy import DDL, event, Column, String, DateTime, UUID, BigInteger, Identity, Integer, Float, ForeignKey, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -15,7 +15,8 @@ class TrainingSession(Base):
     
     __tablename__ = "training_sessions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    public_id = Column(UUID(as_uuid=True), unique=True, nullable=False, server_default=text('gen_random_uuid()'))  # exposed through the API
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     training_pack_id = Column(UUID(as_uuid=True), ForeignKey("training_packs.id"), nullable=False, index=True)
     
@@ -39,7 +40,7 @@ class TrainingSession(Base):
     streak_count = Column(Integer, default=0)  # consecutive successful shots
     
     # Session data
-    shot_data = Column(JSON, nullable=True)  # detailed per-shot data
+    shot_data = Column(JSONB, nullable=True)  # detailed per-shot data
     notes = Column(String(500), nullable=True)  # user notes
     
     # Ratings
@@ -55,6 +56,15 @@ class TrainingSession(Base):
     user = relationship("User", back_populates="training_sessions")
     training_pack = relationship("TrainingPack", back_populates="training_sessions")
     
+    __table_args__ = (
+        Index(
+            'idx_training_sessions_shot_data',
+            'shot_data',
+            postgresql_using='gin',
+            postgresql_where=text('shot_data IS NOT NULL'),
+        ),
+    )
+    
     def __repr__(self):
         return f"<TrainingSession(user_id={self.user_id}, pack_id={self.training_pack_id}, accuracy={self.accuracy})>"
     
@@ -76,3 +86,11 @@ class TrainingSession(Base):
         if self.duration == 0:
             return 0.0
         return (self.attempts / self.duration) * 60
+
+
+# Leave room on each page for HOT updates of streak/personal-best fields
+event.listen(
+    TrainingSession.__table__,
+    "after_create",
+    DDL("ALTER TABLE training_sessions SET (fillfactor = 80)").execute_if(dialect="postgresql"),
+)
@@ -1,9 +1,8 @@
 """
 User model for RocketTrainer.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, UUID, Boolean, Integer
+from sqlalchemy import DDL, event, FetchedValue, Column, String, DateTime, UUID, Boolean, Integer, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -15,7 +14,7 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     steam_id = Column(String(20), unique=True, nullable=True, index=True)
     epic_id = Column(String(50), unique=True, nullable=True, index=True)
     username = Column(String(50), nullable=False)
@@ -33,13 +32,20 @@ class User(Base):
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # set by trigger
     last_login = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     matches = relationship("Match", back_populates="user", cascade="all, delete-orphan")
     training_sessions = relationship("TrainingSession", back_populates="user", cascade="all, delete-orphan")
     
+    # The unique b-trees enforce uniqueness; account lookups are equality-only
+    __table_args__ = (
+        Index('idx_users_steam_id_hash', 'steam_id', postgresql_using='hash'),
+        Index('idx_users_epic_id_hash', 'epic_id', postgresql_using='hash'),
+        Index('idx_users_email_hash', 'email', postgresql_using='hash'),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
     
@@ -52,3 +58,14 @@ class User(Base):
     def primary_platform_id(self) -> str:
         """Get the primary platform ID."""
         return self.steam_id or self.epic_id or str(self.id)
+
+
+# updated_at is maintained by the set_updated_at() trigger (see app.database)
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER trg_users_updated_at BEFORE UPDATE ON users "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    ).execute_if(dialect="postgresql"),
+)
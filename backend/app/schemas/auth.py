@@ -3,7 +3,7 @@ Authentication schemas for request/response validation.
 """
 from typing import Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class UserLogin(BaseModel):
@@ -30,6 +30,8 @@ class UserInToken(BaseModel):
     epic_id: Optional[str] = None
     current_rank: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
 
 class Token(BaseModel):
     """Token response schema."""
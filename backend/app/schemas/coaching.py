@@ -3,7 +3,7 @@ Coaching insights and weakness detection schemas for RocketTrainer.
 """
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PerformanceArea(BaseModel):
@@ -95,6 +95,8 @@ class PerformanceMetrics(BaseModel):
     average_speed: Optional[float] = None
     boost_usage: Optional[float] = None
 
+    model_config = ConfigDict(frozen=True, from_attributes=True, extra='ignore')
+
 
 class AnalysisContext(BaseModel):
     """Schema for match context used in analysis."""
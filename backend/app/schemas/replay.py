@@ -3,7 +3,7 @@ Replay schemas for request/response validation.
 """
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ReplayUpload(BaseModel):
@@ -11,6 +11,11 @@ class ReplayUpload(BaseModel):
     ballchasing_id: str
 
 
+class ReplayBatchUpload(BaseModel):
+    """Schema for importing several Ballchasing.com replays at once."""
+    ballchasing_ids: List[str] = Field(..., min_length=1, max_length=100)
+
+
 class ReplayResponse(BaseModel):
     """Schema for replay response."""
     id: str
@@ -24,8 +29,7 @@ class ReplayResponse(BaseModel):
     processed_at: Optional[datetime] = None
     task_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PlayerStats(BaseModel):
@@ -55,6 +59,8 @@ class PlayerStats(BaseModel):
     defensive_actions: Optional[int] = None
     offensive_actions: Optional[int] = None
 
+    model_config = ConfigDict(frozen=True, from_attributes=True, extra='ignore')
+
 
 class ReplayAnalysis(BaseModel):
     """Schema for detailed replay analysis."""
@@ -72,8 +78,7 @@ class ReplayAnalysis(BaseModel):
     processed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReplaySearchRequest(BaseModel):
@@ -97,6 +102,8 @@ class BallchasingReplayInfo(BaseModel):
     orange_score: int
     uploader: str
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
 
 class ReplaySearchResponse(BaseModel):
     """Schema for Ballchasing.com search results."""
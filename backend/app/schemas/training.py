@@ -3,7 +3,7 @@ Training schemas for request/response validation.
 """
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TrainingPackResponse(BaseModel):
@@ -26,8 +26,7 @@ class TrainingPackResponse(BaseModel):
     is_official: bool = False
     is_featured: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainingSessionCreate(BaseModel):
@@ -57,8 +56,7 @@ class TrainingSessionResponse(BaseModel):
     started_at: datetime
     completed_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainingRecommendation(BaseModel):
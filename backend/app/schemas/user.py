@@ -1,9 +1,16 @@
 """
 User schemas for request/response validation.
 """
-from typing import Optional, Dict, Any, List
+from typing import Annotated, Optional, Dict, Any, List
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+# Lightweight syntax check for profile emails; full EmailStr validation is
+# kept for registration (schemas.auth.UserCreate).
+EmailField = Annotated[
+    str,
+    StringConstraints(pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$', max_length=255, strip_whitespace=True),
+]
 
 
 class UserResponse(BaseModel):
@@ -12,7 +19,7 @@ class UserResponse(BaseModel):
     username: str
     steam_id: Optional[str] = None
     epic_id: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     current_rank: Optional[str] = None
     mmr: Optional[int] = None
     platform: Optional[str] = None
@@ -20,14 +27,13 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
     """Schema for updating user profile."""
     username: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     current_rank: Optional[str] = None
     mmr: Optional[int] = None
 
@@ -53,5 +59,4 @@ class UserStats(BaseModel):
     stats_by_category: Dict[str, Dict[str, Any]]
     recent_matches: List[MatchSummary]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,16 +1,49 @@
 """
 Authentication service for JWT token management and OAuth integration.
 """
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from jose import jwt
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
 import structlog
 
 from app.config import settings
 
 logger = structlog.get_logger()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id; existing bcrypt hashes still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+)
+
+# Successful password checks, keyed by an HMAC of the password and its hash
+_verified_passwords: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# Decoded tokens are reused for up to this many seconds before the signature
+# is checked again.
+TOKEN_CACHE_SECONDS = 30
+
+
+@lru_cache(maxsize=8192)
+def _decode_token(token: str, time_bucket: int) -> Optional[Dict[str, Any]]:
+    """Decode a JWT, memoized per token and time bucket."""
+    try:
+        return jwt.decode(
+            token,
+            settings.secret_key,
+            algorithms=[settings.algorithm]
+        )
+    except jwt.PyJWTError as e:
+        logger.warning("Token verification failed", error=str(e))
+        return None
 
 
 class AuthService:
@@ -39,26 +72,39 @@ class AuthService:
     @staticmethod
     def verify_token(token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode a JWT token."""
-        try:
-            payload = jwt.decode(
-                token, 
-                settings.secret_key, 
-                algorithms=[settings.algorithm]
-            )
-            return payload
-        except jwt.JWTError as e:
-            logger.warning("Token verification failed", error=str(e))
+        now = time.time()
+        payload = _decode_token(token, int(now) // TOKEN_CACHE_SECONDS)
+        if payload is None:
+            return None
+
+        # A cached payload may outlive the token itself
+        expires_at = payload.get("exp")
+        if expires_at is not None and expires_at <= now:
             return None
+
+        return dict(payload)
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using bcrypt."""
+        """Hash a password using Argon2id."""
         return pwd_context.hash(password)
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        cache_key = hmac.new(
+            settings.secret_key.encode(),
+            f"{plain_password}\0{hashed_password}".encode(),
+            hashlib.sha256
+        ).hexdigest()
+        if cache_key in _verified_passwords:
+            return True
+
+        # Only successes are cached; failed guesses always pay the full cost
+        verified = pwd_context.verify(plain_password, hashed_password)
+        if verified:
+            _verified_passwords[cache_key] = True
+        return verified
     
     @staticmethod
     def verify_steam_token(steam_token: str) -> Optional[Dict[str, Any]]:
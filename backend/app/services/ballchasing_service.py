@@ -3,63 +3,206 @@ Ballchasing.com API integration service for fetching Rocket League replay data.
 """
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
+import orjson
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, List, Optional
 import structlog
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from yarl import URL
 
 from app.config import settings
+from app.database import redis_client
 
 logger = structlog.get_logger()
 
+# Processed replays on ballchasing.com don't change, so fetched replays and
+# their parsed stats are kept for a day.
+REPLAY_CACHE_SIZE = 1024
+REPLAY_CACHE_TTL = 24 * 60 * 60
+REPLAY_REDIS_KEY = "bc:replay:{}"
+
+# Built once instead of per request
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+UPLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+# Relative to the session's base_url; search queries are added with update_query
+SEARCH_URL = URL("/api/replays")
+
+# Player stats pulled from each section of a ballchasing player's "stats"
+# object, as (section, ((output key, source key), ...)). Missing values are 0.
+PLAYER_STAT_FIELDS = (
+    ("core", (
+        ("score", "score"),
+        ("goals", "goals"),
+        ("assists", "assists"),
+        ("saves", "saves"),
+        ("shots", "shots"),
+    )),
+    ("boost", (
+        ("boost_usage", "amount_used"),
+    )),
+    ("movement", (
+        ("average_speed", "avg_speed"),
+        ("time_supersonic", "time_supersonic_speed"),
+    )),
+    ("positioning", (
+        ("time_on_ground", "time_on_ground"),
+        ("time_low_air", "time_low_air"),
+        ("time_high_air", "time_high_air"),
+    )),
+)
+
+
+def _extract_player_stats(player: Dict[str, Any], team_color: str) -> Dict[str, Any]:
+    """Flatten one ballchasing player document into the stats we keep."""
+    player_stat = {
+        "player_name": player.get("name", "Unknown"),
+        "player_id": (player.get("id") or {}).get("id", ""),
+        "team": team_color,
+    }
+    stats = player.get("stats") or {}
+    for section, fields in PLAYER_STAT_FIELDS:
+        section_stats = stats.get(section) or {}
+        for out_key, source_key in fields:
+            player_stat[out_key] = section_stats.get(source_key, 0)
+    return player_stat
+
 
 class BallchasingService:
     """Service for interacting with Ballchasing.com API."""
     
-    BASE_URL = "https://ballchasing.com/api"
+    BASE_URL = "https://ballchasing.com"
     
     def __init__(self):
         self.api_key = settings.ballchasing_api_key
         if not self.api_key:
             raise ValueError("Ballchasing API key not configured")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._replay_cache: TTLCache = TTLCache(maxsize=REPLAY_CACHE_SIZE, ttl=REPLAY_CACHE_TTL)
+        self._stats_cache: TTLCache = TTLCache(maxsize=REPLAY_CACHE_SIZE, ttl=REPLAY_CACHE_TTL)
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps connections to ballchasing.com alive
+        between calls instead of paying a TCP + TLS handshake per request.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                base_url=self.BASE_URL,
+                connector=connector,
+                headers={"Authorization": self.api_key}
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def get_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
         """
         Get replay data from Ballchasing.com by replay ID.
         
+        Concurrent calls for the same replay share a single fetch.
+        
         Args:
             replay_id: The Ballchasing.com replay ID
             
         Returns:
             Dict containing replay data or None if not found
         """
-        url = f"{self.BASE_URL}/replays/{replay_id}"
-        headers = {"Authorization": self.api_key}
+        cached = self._replay_cache.get(replay_id)
+        if cached is not None:
+            return cached
+        
+        fetch = self._inflight.get(replay_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_replay(replay_id))
+            self._inflight[replay_id] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(replay_id, None))
+        # Shielded so one caller being cancelled doesn't cancel the others' fetch
+        return await asyncio.shield(fetch)
+    
+    async def _fetch_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a replay from the shared Redis cache or Ballchasing.com."""
+        data = await self._load_shared_replay(replay_id)
+        if data is not None:
+            self._replay_cache[replay_id] = data
+            return data
+        
+        url = f"/api/replays/{replay_id}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info("Successfully fetched replay", replay_id=replay_id)
-                        return data
-                    elif response.status == 404:
-                        logger.warning("Replay not found", replay_id=replay_id)
-                        return None
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            "Failed to fetch replay",
-                            replay_id=replay_id,
-                            status=response.status,
-                            error=error_text
-                        )
-                        return None
-                        
+            session = await self._get_session()
+            response = await session.get(url, timeout=REQUEST_TIMEOUT)
+            try:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    logger.info("Successfully fetched replay", replay_id=replay_id)
+                    # Replays still being processed by ballchasing are incomplete
+                    if data.get("status", "ok") == "ok":
+                        self._replay_cache[replay_id] = data
+                        await self._store_shared_replay(replay_id, data)
+                    return data
+                elif response.status == 404:
+                    logger.warning("Replay not found", replay_id=replay_id)
+                    return None
+                else:
+                    error_text = await response.text()
+                    logger.error(
+                        "Failed to fetch replay",
+                        replay_id=replay_id,
+                        status=response.status,
+                        error=error_text
+                    )
+                    return None
+            finally:
+                response.release()
+                
         except asyncio.TimeoutError:
             logger.error("Timeout fetching replay", replay_id=replay_id)
             return None
-        except Exception as e:
+        except aiohttp.ClientError as e:
             logger.error("Error fetching replay", replay_id=replay_id, error=str(e))
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid replay response", replay_id=replay_id, error=str(e))
+            return None
+    
+    async def _load_shared_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Read a replay from the Redis cache shared by all workers.
+        
+        Returns None on a miss, so the caller fetches from Ballchasing.com.
+        An unavailable Redis or a corrupt entry counts as a miss; corrupt
+        entries are deleted so the fetch replaces them.
+        """
+        key = REPLAY_REDIS_KEY.format(replay_id)
+        try:
+            raw = await redis_client.get(key)
+            if raw is None:
+                return None
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError as e:
+                logger.warning("Discarding corrupt cached replay", replay_id=replay_id, error=str(e))
+                await redis_client.delete(key)
+                return None
+        except RedisError as e:
+            logger.warning("Replay cache read failed", replay_id=replay_id, error=str(e))
+            return None
+    
+    async def _store_shared_replay(self, replay_id: str, data: Dict[str, Any]):
+        """Write a fetched replay to the Redis cache shared by all workers."""
+        try:
+            await redis_client.setex(REPLAY_REDIS_KEY.format(replay_id), REPLAY_CACHE_TTL, orjson.dumps(data))
+        except RedisError as e:
+            logger.warning("Replay cache write failed", replay_id=replay_id, error=str(e))
     
     async def search_replays(
         self,
@@ -84,49 +227,48 @@ class BallchasingService:
         Returns:
             Dict containing search results or None if error
         """
-        url = f"{self.BASE_URL}/replays"
-        headers = {"Authorization": self.api_key}
-        
+        filters = {"player-name": player_name, "playlist": playlist, "season": season}
         params = {
             "count": min(count, 200),  # API limit
             "sort-by": sort_by,
-            "sort-dir": sort_dir
+            "sort-dir": sort_dir,
+            **{key: value for key, value in filters.items() if value}
         }
-        
-        if player_name:
-            params["player-name"] = player_name
-        if playlist:
-            params["playlist"] = playlist
-        if season:
-            params["season"] = season
+        url = SEARCH_URL.update_query(params)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params, timeout=30) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(
-                            "Successfully searched replays",
-                            count=data.get("count", 0),
-                            params=params
-                        )
-                        return data
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            "Failed to search replays",
-                            status=response.status,
-                            error=error_text,
-                            params=params
-                        )
-                        return None
-                        
+            session = await self._get_session()
+            response = await session.get(url, timeout=REQUEST_TIMEOUT)
+            try:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    logger.info(
+                        "Successfully searched replays",
+                        count=data.get("count", 0),
+                        params=params
+                    )
+                    return data
+                else:
+                    error_text = await response.text()
+                    logger.error(
+                        "Failed to search replays",
+                        status=response.status,
+                        error=error_text,
+                        params=params
+                    )
+                    return None
+            finally:
+                response.release()
+                
         except asyncio.TimeoutError:
             logger.error("Timeout searching replays", params=params)
             return None
-        except Exception as e:
+        except aiohttp.ClientError as e:
             logger.error("Error searching replays", error=str(e), params=params)
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid search response", error=str(e), params=params)
+            return None
     
     async def get_replay_stats(self, replay_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -138,6 +280,10 @@ class BallchasingService:
         Returns:
             Dict containing player stats or None if not found
         """
+        cached = self._stats_cache.get(replay_id)
+        if cached is not None:
+            return cached
+        
         # First get the basic replay data
         replay_data = await self.get_replay(replay_id)
         if not replay_data:
@@ -145,55 +291,70 @@ class BallchasingService:
         
         # Extract player statistics
         try:
-            teams = ["blue", "orange"]
+            blue_team = replay_data.get("blue") or {}
+            orange_team = replay_data.get("orange") or {}
 
-            player_stats = []
-            for team_color in teams:
-                team_data = replay_data.get(team_color, {})
-                team_players = team_data.get("players", [])
-                for player in team_players:
-                    stats = player.get("stats", {})
-                    core_stats = stats.get("core", {})
-                    boost_stats = stats.get("boost", {})
-                    movement_stats = stats.get("movement", {})
-                    positioning_stats = stats.get("positioning", {})
-                    
-                    player_stat = {
-                        "player_name": player.get("name", "Unknown"),
-                        "player_id": player.get("id", {}).get("id", ""),
-                        "team": team_color,
-                        "score": core_stats.get("score", 0),
-                        "goals": core_stats.get("goals", 0),
-                        "assists": core_stats.get("assists", 0),
-                        "saves": core_stats.get("saves", 0),
-                        "shots": core_stats.get("shots", 0),
-                        "boost_usage": boost_stats.get("amount_used", 0),
-                        "average_speed": movement_stats.get("avg_speed", 0),
-                        "time_supersonic": movement_stats.get("time_supersonic_speed", 0),
-                        "time_on_ground": positioning_stats.get("time_on_ground", 0),
-                        "time_low_air": positioning_stats.get("time_low_air", 0),
-                        "time_high_air": positioning_stats.get("time_high_air", 0),
-                    }
-                    player_stats.append(player_stat)
+            player_stats = [
+                _extract_player_stats(player, team_color)
+                for player, team_color in chain(
+                    ((p, "blue") for p in blue_team.get("players") or ()),
+                    ((p, "orange") for p in orange_team.get("players") or ())
+                )
+            ]
+            players_by_id = {}
+            for player_stat in player_stats:
+                players_by_id.setdefault(player_stat["player_id"], player_stat)
             
-            return {
+            replay_stats = {
                 "replay_id": replay_id,
                 "players": player_stats,
+                "players_by_id": players_by_id,
                 "match_info": {
                     "playlist": replay_data.get("playlist_name", "unknown"),
                     "duration": replay_data.get("duration", 0),
                     "date": replay_data.get("date", ""),
                     "score": {
-                        "blue": replay_data.get("blue", {}).get("goals", 0),
-                        "orange": replay_data.get("orange", {}).get("goals", 0)
+                        "blue": blue_team.get("goals", 0),
+                        "orange": orange_team.get("goals", 0)
                     }
                 }
             }
+            if replay_id in self._replay_cache:
+                self._stats_cache[replay_id] = replay_stats
+            return replay_stats
             
         except Exception as e:
             logger.error("Error parsing replay stats", replay_id=replay_id, error=str(e))
             return None
     
+    async def get_replay_stats_many(self, replay_ids: List[str], concurrency: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Get player statistics for several replays concurrently.
+        
+        Args:
+            replay_ids: The Ballchasing.com replay IDs
+            concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Dict mapping replay ID to its stats; replays that could not be
+            fetched or parsed are left out
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(replay_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_replay_stats(replay_id)
+        
+        results = await asyncio.gather(*(fetch(replay_id) for replay_id in replay_ids), return_exceptions=True)
+        
+        stats_by_id = {}
+        for replay_id, result in zip(replay_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to fetch replay stats", replay_id=replay_id, error=str(result))
+            elif result is not None:
+                stats_by_id[replay_id] = result
+        return stats_by_id
+    
     async def upload_replay(self, replay_file_content: bytes, filename: str) -> Optional[Dict[str, Any]]:
         """
         Upload a replay file to Ballchasing.com.
@@ -205,35 +366,37 @@ class BallchasingService:
         Returns:
             Dict containing upload result or None if failed
         """
-        url = f"{self.BASE_URL}/v2/upload"
-        headers = {"Authorization": self.api_key}
+        url = "/api/v2/upload"
         
         try:
             data = aiohttp.FormData()
             data.add_field('file', replay_file_content, filename=filename, content_type='application/octet-stream')
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=data, timeout=60) as response:
-                    if response.status == 201:
-                        result = await response.json()
-                        logger.info("Successfully uploaded replay", filename=filename, replay_id=result.get("id"))
-                        return result
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            "Failed to upload replay",
-                            filename=filename,
-                            status=response.status,
-                            error=error_text
-                        )
-                        return None
-                        
+            session = await self._get_session()
+            async with session.post(url, data=data, timeout=UPLOAD_TIMEOUT) as response:
+                if response.status == 201:
+                    result = orjson.loads(await response.read())
+                    logger.info("Successfully uploaded replay", filename=filename, replay_id=result.get("id"))
+                    return result
+                else:
+                    error_text = await response.text()
+                    logger.error(
+                        "Failed to upload replay",
+                        filename=filename,
+                        status=response.status,
+                        error=error_text
+                    )
+                    return None
+                    
         except asyncio.TimeoutError:
             logger.error("Timeout uploading replay", filename=filename)
             return None
-        except Exception as e:
+        except aiohttp.ClientError as e:
             logger.error("Error uploading replay", filename=filename, error=str(e))
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid upload response", filename=filename, error=str(e))
+            return None
     
     def extract_player_stats_for_user(self, replay_stats: Dict[str, Any], user_steam_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -249,18 +412,26 @@ class BallchasingService:
         if not replay_stats or "players" not in replay_stats:
             return None
 
-        # Log available players for debugging
-        available_players = []
-        for player in replay_stats["players"]:
-            player_id = player.get("player_id", "")
-            player_name = player.get("player_name", "Unknown")
-            available_players.append(f"{player_name}({player_id})")
-
-            # Match by Steam ID (player_id contains Steam ID)
-            if player.get("player_id") == user_steam_id:
-                logger.info("User found in replay", user_steam_id=user_steam_id, player_name=player_name)
-                return player
+        # Match by Steam ID (player_id contains Steam ID). Stats stored before
+        # the index existed have no players_by_id; scan those, stopping at the
+        # first match.
+        players_by_id = replay_stats.get("players_by_id")
+        if players_by_id is not None:
+            player = players_by_id.get(user_steam_id)
+        else:
+            player = next(
+                (p for p in replay_stats["players"] if p.get("player_id") == user_steam_id),
+                None
+            )
+        if player is not None:
+            logger.info("User found in replay", user_steam_id=user_steam_id, player_name=player.get("player_name", "Unknown"))
+            return player
 
+        # Log available players for debugging
+        available_players = [
+            f"{p.get('player_name', 'Unknown')}({p.get('player_id', '')})"
+            for p in replay_stats["players"]
+        ]
         logger.warning("User not found in replay",
                       user_steam_id=user_steam_id,
                       available_players=available_players)
@@ -277,5 +448,13 @@ class BallchasingService:
         return None
 
 
-# Global instance
-ballchasing_service = BallchasingService()
+@lru_cache(maxsize=1)
+def get_ballchasing_service() -> BallchasingService:
+    """Get the process-wide BallchasingService, creating it on first use."""
+    return BallchasingService()
+
+
+async def close_ballchasing_service():
+    """Close the shared service's HTTP session if the service was ever created."""
+    if get_ballchasing_service.cache_info().currsize:
+        await get_ballchasing_service().aclose()
@@ -1,19 +1,74 @@
 """
 Replay processing service for analyzing Rocket League replays.
 """
+import asyncio
 import json
-from typing import Dict, Any, Optional
+import logging
+import os
+import random
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
+import ciso8601
 import structlog
+from sqlalchemy import select, update
 
 from app.config import settings
 from app.database import SessionLocal
 from app.models.match import Match
 from app.models.user import User
 from app.models.player_stats import PlayerStats
-from app.services.ballchasing_service import ballchasing_service
+from app.services.ballchasing_service import get_ballchasing_service
+from app.tasks.replay_processing import (
+    process_ballchasing_batch as process_ballchasing_batch_task,
+    process_replay_file as process_replay_task,
+)
 
 logger = structlog.get_logger()
+# structlog hands records to this stdlib logger; checked before log calls
+# whose arguments are costly to build
+stdlib_logger = logging.getLogger(__name__)
+
+# Choices for the MVP mock analysis
+MOCK_PLAYLISTS = ("ranked-duels", "ranked-doubles", "ranked-standard")
+MOCK_RESULTS = ("win", "loss")
+MOCK_RNG = random.Random()
+
+# Match columns filled from the user's replay stats, with their defaults
+MATCH_STAT_DEFAULTS = (
+    ("goals", 0),
+    ("assists", 0),
+    ("saves", 0),
+    ("shots", 0),
+    ("score", 0),
+    ("boost_usage", 0.0),
+    ("average_speed", 0.0),
+    ("time_supersonic", 0.0),
+    ("time_on_ground", 0.0),
+    ("time_low_air", 0.0),
+    ("time_high_air", 0.0),
+)
+
+# Time-series stats recorded per processed match, as
+# (stat_type, category, match column holding the value)
+PLAYER_STAT_ROWS = (
+    ("match_performance", "core", "score"),
+    ("goals", "core", "goals"),
+    ("assists", "core", "assists"),
+    ("saves", "core", "saves"),
+    ("shots", "core", "shots"),
+    ("boost_usage", "boost", "boost_usage"),
+    ("average_speed", "movement", "average_speed"),
+    ("time_supersonic", "movement", "time_supersonic"),
+    ("time_on_ground", "positioning", "time_on_ground"),
+    ("time_low_air", "positioning", "time_low_air"),
+    ("time_high_air", "positioning", "time_high_air"),
+)
+
+# Matches per queued Ballchasing batch task; each batch is written with one UPDATE
+BALLCHASING_BATCH_SIZE = 25
+
+# Player details kept in a ballchasing match's replay_data
+REPLAY_PLAYER_FIELDS = ("player_id", "player_name", "team")
 
 
 class ReplayService:
@@ -30,12 +85,15 @@ class ReplayService:
                    filename=filename,
                    file_size=len(file_content))
 
+        # The worker reads the file from the shared upload directory, so the
+        # replay bytes don't travel through the broker
+        upload_path = os.path.join(settings.upload_dir, f"{match_id}.replay")
+
         try:
-            # Import here to avoid circular imports
-            from app.tasks.replay_processing import process_replay_file as process_task
+            await asyncio.to_thread(ReplayService._save_upload, upload_path, file_content)
 
             # Queue the processing task
-            task = process_task.delay(match_id, file_content, filename)
+            task = process_replay_task.delay(match_id, upload_path, filename)
 
             logger.info("Replay processing task queued",
                        match_id=match_id,
@@ -50,15 +108,20 @@ class ReplayService:
                         filename=filename,
                         error=str(e))
 
+            if os.path.exists(upload_path):
+                os.unlink(upload_path)
+
             # Mark match as failed immediately
             db = SessionLocal()
             try:
-                match = db.query(Match).filter(Match.id == match_id).first()
-                if match:
-                    match.processed = True
-                    match.processed_at = datetime.utcnow()
-                    match.replay_data = {"error": f"Failed to queue processing: {str(e)}", "status": "failed"}
-                    db.commit()
+                db.execute(
+                    update(Match).where(Match.id == match_id).values(
+                        processed=True,
+                        processed_at=datetime.now(timezone.utc),
+                        replay_data={"error": f"Failed to queue processing: {str(e)}", "status": "failed"}
+                    ).execution_options(synchronize_session=False)
+                )
+                db.commit()
             except Exception as db_error:
                 logger.error("Failed to update match status", error=str(db_error))
             finally:
@@ -66,6 +129,43 @@ class ReplayService:
 
             raise
     
+    @staticmethod
+    def _save_upload(path: str, content: bytes):
+        """Write an uploaded replay file to the shared upload directory."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+    
+    @staticmethod
+    def queue_ballchasing_batches(match_ids: List[str]) -> List[str]:
+        """
+        Queue imported Ballchasing matches for batched processing.
+        
+        The ids are split into chunks of BALLCHASING_BATCH_SIZE and each chunk
+        is queued as one process_ballchasing_batch task.
+        
+        Returns:
+            Ids of the queued tasks, one per chunk
+        """
+        task_ids = []
+        for start in range(0, len(match_ids), BALLCHASING_BATCH_SIZE):
+            chunk = match_ids[start:start + BALLCHASING_BATCH_SIZE]
+            try:
+                task = process_ballchasing_batch_task.delay(chunk)
+            except Exception as e:
+                logger.error("Failed to queue Ballchasing batch",
+                            match_count=len(chunk),
+                            error=str(e))
+                for match_id in match_ids[start:]:
+                    ReplayService._mark_match_failed(match_id, f"Failed to queue processing: {str(e)}")
+                raise
+            task_ids.append(task.id)
+
+        logger.info("Ballchasing batches queued",
+                   match_count=len(match_ids),
+                   task_count=len(task_ids))
+        return task_ids
+
     @staticmethod
     async def process_ballchasing_replay(match_id: str, ballchasing_id: str):
         """Process a replay from Ballchasing.com using the actual API."""
@@ -79,23 +179,24 @@ class ReplayService:
 
         db = SessionLocal()
         try:
-            match = db.query(Match).filter(Match.id == match_id).first()
-            if not match:
+            # Only the ids are needed, so fetch them in one joined query
+            # instead of loading the Match and then its User
+            row = db.execute(
+                select(Match.id, Match.user_id, Match.ballchasing_id, User.steam_id)
+                .join(User, User.id == Match.user_id)
+                .where(Match.id == match_id)
+            ).one_or_none()
+            if row is None:
                 logger.error("Match not found for processing", match_id=match_id)
                 return
 
-            user = db.query(User).filter(User.id == match.user_id).first()
-            if not user:
-                logger.error("User not found for match", match_id=match_id, user_id=str(match.user_id))
-                return
-
             # Store the info we need
             match_info = {
-                'id': match.id,
-                'user_id': match.user_id,
-                'ballchasing_id': match.ballchasing_id
+                'id': row.id,
+                'user_id': row.user_id,
+                'ballchasing_id': row.ballchasing_id
             }
-            user_steam_id = user.steam_id
+            user_steam_id = row.steam_id
 
         except Exception as e:
             logger.error("Error fetching match info", match_id=match_id, error=str(e))
@@ -106,7 +207,7 @@ class ReplayService:
 
         # Step 2: Fetch replay data from Ballchasing.com (no database involved)
         try:
-            replay_stats = await ballchasing_service.get_replay_stats(ballchasing_id)
+            replay_stats = await get_ballchasing_service().get_replay_stats(ballchasing_id)
             if not replay_stats:
                 logger.error("Failed to fetch replay from Ballchasing", ballchasing_id=ballchasing_id)
                 ReplayService._mark_match_failed(match_id, "Failed to fetch from Ballchasing.com")
@@ -118,23 +219,124 @@ class ReplayService:
 
         # Step 3: Process the replay data
         try:
-            # Extract match information
-            match_info_data = replay_stats.get("match_info", {})
-            score = match_info_data.get("score", {})
+            match_updates = ReplayService._build_match_updates(
+                match_id, ballchasing_id, replay_stats, user_steam_id
+            )
+        except Exception as e:
+            logger.error("Error processing replay data", ballchasing_id=ballchasing_id, error=str(e))
+            ReplayService._mark_match_failed(match_id, f"Error processing replay: {str(e)}")
+            return
 
-            # Extract match information with detailed logging
-            logger.info("Processing match data",
-                       match_id=match_id,
-                       playlist=match_info_data.get("playlist", "unknown"),
-                       duration=match_info_data.get("duration", 0),
-                       blue_score=score.get("blue", 0),
-                       orange_score=score.get("orange", 0))
+        # Step 4: Update the database with a fresh, short transaction, then
+        # record the user's stats in the time-series table
+        if ReplayService._update_match_with_data(match_id, match_updates):
+            ReplayService._create_player_stats_records(
+                ReplayService._player_stats_rows(match_info['id'], match_info['user_id'], match_updates)
+            )
+        logger.info("Ballchasing replay processed successfully", match_id=match_id, ballchasing_id=ballchasing_id)
 
-            # Find user's stats in the replay
-            user_stats = ballchasing_service.extract_player_stats_for_user(replay_stats, user_steam_id)
+    @staticmethod
+    async def process_ballchasing_batch(match_ids: List[str]) -> int:
+        """
+        Process several Ballchasing matches together.
+        
+        The matches are read with one SELECT, their replays fetched
+        concurrently, and all successful results written with a single
+        executemany UPDATE. Matches whose replay can't be fetched or parsed
+        are marked failed individually.
+        
+        Returns:
+            Number of matches updated
+        """
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(Match.id, Match.user_id, Match.ballchasing_id, User.steam_id)
+                .join(User, User.id == Match.user_id)
+                .where(Match.id.in_(match_ids), Match.ballchasing_id.isnot(None))
+            ).all()
+        finally:
+            db.close()
 
-            # Log user stats extraction result
-            if user_stats:
+        if len(rows) < len(match_ids):
+            logger.warning("Matches not found for batch processing",
+                          requested=len(match_ids),
+                          found=len(rows))
+
+        replay_stats = await get_ballchasing_service().get_replay_stats_many(
+            [row.ballchasing_id for row in rows]
+        )
+
+        updates = []
+        stats_rows = []
+        for row in rows:
+            match_id = str(row.id)
+            stats = replay_stats.get(row.ballchasing_id)
+            if not stats:
+                ReplayService._mark_match_failed(match_id, "Failed to fetch from Ballchasing.com")
+                continue
+            try:
+                match_updates = ReplayService._build_match_updates(
+                    match_id, row.ballchasing_id, stats, row.steam_id
+                )
+            except Exception as e:
+                logger.error("Error processing replay data", ballchasing_id=row.ballchasing_id, error=str(e))
+                ReplayService._mark_match_failed(match_id, f"Error processing replay: {str(e)}")
+                continue
+            updates.append({'id': row.id, **match_updates})
+            stats_rows.extend(ReplayService._player_stats_rows(row.id, row.user_id, match_updates))
+
+        if updates:
+            db = SessionLocal()
+            try:
+                # Bulk UPDATE by primary key: one executemany for the whole batch
+                db.execute(update(Match), updates)
+                db.commit()
+            except Exception as e:
+                logger.error("Failed to update match batch", count=len(updates), error=str(e))
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            ReplayService._create_player_stats_records(stats_rows)
+
+        logger.info("Ballchasing batch processed", requested=len(match_ids), updated=len(updates))
+        return len(updates)
+
+    @staticmethod
+    def _build_match_updates(
+        match_id: str,
+        ballchasing_id: str,
+        replay_stats: Dict[str, Any],
+        user_steam_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the Match column updates for a parsed Ballchasing replay."""
+        # Used for processed_at and as the fallback match date
+        now = datetime.now(timezone.utc)
+
+        # Extract match information
+        match_info_data = replay_stats.get("match_info", {})
+        score = match_info_data.get("score", {})
+        playlist = match_info_data.get("playlist", "unknown")
+        duration = match_info_data.get("duration", 0)
+        blue_score = score.get("blue", 0)
+        orange_score = score.get("orange", 0)
+
+        # Extract match information with detailed logging
+        logger.info("Processing match data",
+                   match_id=match_id,
+                   playlist=playlist,
+                   duration=duration,
+                   blue_score=blue_score,
+                   orange_score=orange_score)
+
+        # Find user's stats in the replay
+        user_stats = get_ballchasing_service().extract_player_stats_for_user(replay_stats, user_steam_id)
+
+        # Log user stats extraction result
+        if user_stats:
+            if stdlib_logger.isEnabledFor(logging.INFO):
                 logger.info("User stats extracted successfully",
                            match_id=match_id,
                            user_steam_id=user_steam_id,
@@ -144,73 +346,70 @@ class ReplayService:
                            saves=user_stats.get("saves", 0),
                            shots=user_stats.get("shots", 0),
                            score=user_stats.get("score", 0))
-            else:
-                logger.warning("No user stats extracted",
-                             match_id=match_id,
-                             user_steam_id=user_steam_id)
-
-            # Prepare match updates
-            match_updates = {
-                'playlist': match_info_data.get("playlist", "unknown"),
-                'duration': match_info_data.get("duration", 0),
-                'score_team_0': score.get("blue", 0),
-                'score_team_1': score.get("orange", 0),
-                'replay_data': replay_stats,
-                'processed': True,
-                'processed_at': datetime.now(timezone.utc)
-            }
+        else:
+            logger.warning("No user stats extracted",
+                         match_id=match_id,
+                         user_steam_id=user_steam_id)
+
+        # Prepare match updates
+        match_updates = {
+            'playlist': playlist,
+            'duration': duration,
+            'score_team_0': blue_score,
+            'score_team_1': orange_score,
+            # Per-player stats are already flattened into the match columns,
+            # so only the identifying details of the replay are kept
+            'replay_data': {
+                'source': "ballchasing.com",
+                'ballchasing_id': ballchasing_id,
+                'match_info': match_info_data,
+                'players': [
+                    {k: player.get(k) for k in REPLAY_PLAYER_FIELDS}
+                    for player in replay_stats.get("players", ())
+                ]
+            },
+            'processed': True,
+            'processed_at': now
+        }
 
-            # Parse match date
-            try:
-                if match_info_data.get("date"):
-                    match_updates['match_date'] = datetime.fromisoformat(match_info_data["date"].replace("Z", "+00:00"))
-                else:
-                    match_updates['match_date'] = datetime.now(timezone.utc)
-            except:
-                match_updates['match_date'] = datetime.now(timezone.utc)
-
-            # Add user stats to match updates if available
-            if user_stats:
-                # Add player stats to updates
-                player_stats_updates = {
-                    'goals': user_stats.get("goals", 0),
-                    'assists': user_stats.get("assists", 0),
-                    'saves': user_stats.get("saves", 0),
-                    'shots': user_stats.get("shots", 0),
-                    'score': user_stats.get("score", 0),
-                    'boost_usage': user_stats.get("boost_usage", 0.0),
-                    'average_speed': user_stats.get("average_speed", 0.0),
-                    'time_supersonic': user_stats.get("time_supersonic", 0.0),
-                    'time_on_ground': user_stats.get("time_on_ground", 0.0),
-                    'time_low_air': user_stats.get("time_low_air", 0.0),
-                    'time_high_air': user_stats.get("time_high_air", 0.0)
-                }
-
-                match_updates.update(player_stats_updates)
-
-                logger.info("Added player stats to match updates",
-                           match_id=match_id,
-                           player_stats=player_stats_updates)
+        # Parse match date; ciso8601 accepts the trailing "Z" ballchasing uses
+        match_date = match_info_data.get("date")
+        try:
+            match_updates['match_date'] = ciso8601.parse_datetime(match_date) if match_date else now
+        except ValueError:
+            match_updates['match_date'] = now
+
+        # Add user stats to match updates if available
+        if user_stats:
+            # Add player stats to updates
+            player_stats_updates = {
+                field: user_stats.get(field, default) for field, default in MATCH_STAT_DEFAULTS
+            }
 
-                # Determine result based on team and score
-                user_team = user_stats.get("team", "blue")
-                if user_team == "blue":
-                    match_updates['result'] = "win" if score.get("blue", 0) > score.get("orange", 0) else "loss"
-                else:
-                    match_updates['result'] = "win" if score.get("orange", 0) > score.get("blue", 0) else "loss"
+            match_updates.update(player_stats_updates)
 
-                if score.get("blue", 0) == score.get("orange", 0):
-                    match_updates['result'] = "draw"
+            logger.info("Added player stats to match updates",
+                       match_id=match_id,
+                       player_stats=player_stats_updates)
 
-                logger.info("Determined match result",
-                           match_id=match_id,
-                           user_team=user_team,
-                           result=match_updates['result'])
+            # Determine result based on team and score
+            user_team = user_stats.get("team", "blue")
+            score_diff = blue_score - orange_score
+            if score_diff == 0:
+                match_updates['result'] = "draw"
             else:
-                logger.warning("User not found in replay", ballchasing_id=ballchasing_id, user_steam_id=user_steam_id)
-                match_updates['result'] = "unknown"
+                match_updates['result'] = "win" if (score_diff > 0) == (user_team == "blue") else "loss"
 
-            # Log final match updates before database operation
+            logger.info("Determined match result",
+                       match_id=match_id,
+                       user_team=user_team,
+                       result=match_updates['result'])
+        else:
+            logger.warning("User not found in replay", ballchasing_id=ballchasing_id, user_steam_id=user_steam_id)
+            match_updates['result'] = "unknown"
+
+        # Log final match updates before database operation
+        if stdlib_logger.isEnabledFor(logging.INFO):
             logger.info("Final match updates prepared",
                        match_id=match_id,
                        updates_keys=list(match_updates.keys()),
@@ -220,26 +419,22 @@ class ReplayService:
                        score=match_updates.get('score', 'not_set'),
                        processed=match_updates.get('processed'))
 
-        except Exception as e:
-            logger.error("Error processing replay data", ballchasing_id=ballchasing_id, error=str(e))
-            ReplayService._mark_match_failed(match_id, f"Error processing replay: {str(e)}")
-            return
-
-        # Step 4: Update the database with a fresh, short transaction
-        ReplayService._update_match_with_data(match_id, match_updates)
-        logger.info("Ballchasing replay processed successfully", match_id=match_id, ballchasing_id=ballchasing_id)
+        return match_updates
 
     @staticmethod
     def _mark_match_failed(match_id: str, error_message: str):
         """Mark a match as failed with error message."""
         db = SessionLocal()
         try:
-            match = db.query(Match).filter(Match.id == match_id).first()
-            if match:
-                match.processed = True
-                match.processed_at = datetime.now(timezone.utc)
-                match.replay_data = {"error": error_message, "status": "failed"}
-                db.commit()
+            result = db.execute(
+                update(Match).where(Match.id == match_id).values(
+                    processed=True,
+                    processed_at=datetime.now(timezone.utc),
+                    replay_data={"error": error_message, "status": "failed"}
+                ).execution_options(synchronize_session=False)
+            )
+            db.commit()
+            if result.rowcount:
                 logger.info("Match marked as failed", match_id=match_id, error=error_message)
         except Exception as e:
             logger.error("Failed to mark match as failed", match_id=match_id, error=str(e))
@@ -248,58 +443,32 @@ class ReplayService:
             db.close()
 
     @staticmethod
-    def _update_match_with_data(match_id: str, match_updates: Dict[str, Any]):
-        """Update match with processed data using a fresh transaction."""
-        logger.info("Starting database update",
-                   match_id=match_id,
-                   update_fields=list(match_updates.keys()),
-                   goals_value=match_updates.get('goals', 'not_provided'),
-                   score_value=match_updates.get('score', 'not_provided'))
+    def _update_match_with_data(match_id: str, match_updates: Dict[str, Any]) -> bool:
+        """Update match with processed data using a fresh transaction.
 
+        Returns whether the match was found and updated.
+        """
         db = SessionLocal()
         try:
-            match = db.query(Match).filter(Match.id == match_id).first()
-            if match:
-                logger.info("Match found in database",
-                           match_id=match_id,
-                           current_goals=match.goals,
-                           current_score=match.score,
-                           current_processed=match.processed)
-
-                # Log before updating each field
-                for field, value in match_updates.items():
-                    old_value = getattr(match, field, None)
-                    setattr(match, field, value)
-                    logger.debug("Updated field",
-                               match_id=match_id,
-                               field=field,
-                               old_value=old_value,
-                               new_value=value)
-
-                # Flush to ensure changes are prepared
-                db.flush()
-
-                # Log values before commit
-                logger.info("About to commit changes",
-                           match_id=match_id,
-                           goals_after_update=match.goals,
-                           score_after_update=match.score,
-                           playlist_after_update=match.playlist,
-                           processed_after_update=match.processed)
-
+            # One UPDATE statement; no SELECT beforehand or refresh afterwards
+            result = db.execute(
+                update(Match)
+                .where(Match.id == match_id)
+                .values(**match_updates)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
                 db.commit()
-
-                # Verify the commit worked by refreshing and checking
-                db.refresh(match)
                 logger.info("Match updated and committed successfully",
                            match_id=match_id,
-                           final_goals=match.goals,
-                           final_score=match.score,
-                           final_playlist=match.playlist,
-                           final_duration=match.duration,
-                           final_processed=match.processed)
-            else:
-                logger.error("Match not found for update", match_id=match_id)
+                           final_goals=match_updates.get('goals'),
+                           final_score=match_updates.get('score'),
+                           final_playlist=match_updates.get('playlist'),
+                           final_duration=match_updates.get('duration'),
+                           final_processed=match_updates.get('processed'))
+                return True
+            logger.error("Match not found for update", match_id=match_id)
+            return False
         except Exception as e:
             logger.error("Failed to update match",
                         match_id=match_id,
@@ -312,60 +481,43 @@ class ReplayService:
             db.close()
 
     @staticmethod
-    async def _create_player_stats_record(match: Match, user_stats: Optional[Dict[str, Any]], replay_stats: Dict[str, Any]):
+    def _player_stats_rows(match_id: str, user_id, match_updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the time-series stat rows for a processed match.
+
+        Returns no rows when the user wasn't found in the replay, since the
+        match then carries no player stats.
+        """
+        if 'goals' not in match_updates:
+            return []
+        return [
+            {
+                "time": match_updates['match_date'],
+                "user_id": user_id,
+                "match_id": match_id,
+                "stat_type": stat_name,
+                "category": category,
+                "value": float(match_updates[column]),
+                "playlist": match_updates['playlist'],
+                "sample_size": 1.0,
+            }
+            for stat_name, category, column in PLAYER_STAT_ROWS
+            if match_updates.get(column) is not None
+        ]
+
+    @staticmethod
+    def _create_player_stats_records(rows: List[Dict[str, Any]]):
         """Create detailed player stats records in the time-series database."""
-        if not user_stats:
+        if not rows:
             return
 
         # Use a new database session for player stats
         db = SessionLocal()
         try:
-            # Create player stats record for time-series analysis
-            player_stat = PlayerStats(
-                time=match.match_date,
-                user_id=match.user_id,
-                match_id=match.id,
-                stat_type="match_performance",
-                category="core",
-                value=float(user_stats.get("score", 0)),
-                playlist=match.playlist,
-                sample_size=1.0
-            )
-            db.add(player_stat)
-
-            # Add individual stat records for detailed analysis
-            stats_to_record = [
-                ("goals", "core", user_stats.get("goals", 0)),
-                ("assists", "core", user_stats.get("assists", 0)),
-                ("saves", "core", user_stats.get("saves", 0)),
-                ("shots", "core", user_stats.get("shots", 0)),
-                ("boost_usage", "boost", user_stats.get("boost_usage", 0.0)),
-                ("average_speed", "movement", user_stats.get("average_speed", 0.0)),
-                ("time_supersonic", "movement", user_stats.get("time_supersonic", 0.0)),
-                ("time_on_ground", "positioning", user_stats.get("time_on_ground", 0.0)),
-                ("time_low_air", "positioning", user_stats.get("time_low_air", 0.0)),
-                ("time_high_air", "positioning", user_stats.get("time_high_air", 0.0)),
-            ]
-
-            for stat_name, category, value in stats_to_record:
-                if value is not None:
-                    stat_record = PlayerStats(
-                        time=match.match_date,
-                        user_id=match.user_id,
-                        match_id=match.id,
-                        stat_type=stat_name,
-                        category=category,
-                        value=float(value),
-                        playlist=match.playlist,
-                        sample_size=1.0
-                    )
-                    db.add(stat_record)
-
+            inserted = PlayerStats.bulk_insert(db, rows)
             db.commit()
-            logger.info("Player stats records created", match_id=str(match.id), stats_count=len(stats_to_record) + 1)
-
+            logger.info("Player stats records created", stats_count=inserted)
         except Exception as e:
-            logger.error("Failed to create player stats records", match_id=str(match.id), error=str(e))
+            logger.error("Failed to create player stats records", stats_count=len(rows), error=str(e))
             db.rollback()
         finally:
             db.close()
@@ -373,29 +525,24 @@ class ReplayService:
     @staticmethod
     def _mock_replay_analysis(filename: str) -> Dict[str, Any]:
         """Create mock replay analysis data for MVP."""
-        import random
-        
-        playlists = ["ranked-duels", "ranked-doubles", "ranked-standard"]
-        results = ["win", "loss"]
-        
         return {
-            "playlist": random.choice(playlists),
-            "duration": random.randint(240, 420),  # 4-7 minutes
-            "score_team_0": random.randint(0, 5),
-            "score_team_1": random.randint(0, 5),
-            "result": random.choice(results),
+            "playlist": MOCK_RNG.choice(MOCK_PLAYLISTS),
+            "duration": MOCK_RNG.randint(240, 420),  # 4-7 minutes
+            "score_team_0": MOCK_RNG.randint(0, 5),
+            "score_team_1": MOCK_RNG.randint(0, 5),
+            "result": MOCK_RNG.choice(MOCK_RESULTS),
             "player_stats": {
-                "goals": random.randint(0, 3),
-                "assists": random.randint(0, 2),
-                "saves": random.randint(0, 4),
-                "shots": random.randint(1, 8),
-                "score": random.randint(100, 800),
-                "boost_usage": round(random.uniform(0.3, 0.9), 2),
-                "average_speed": round(random.uniform(800, 1200), 1),
-                "time_supersonic": round(random.uniform(10, 60), 1),
-                "time_on_ground": round(random.uniform(60, 90), 1),
-                "time_low_air": round(random.uniform(5, 20), 1),
-                "time_high_air": round(random.uniform(1, 10), 1)
+                "goals": MOCK_RNG.randint(0, 3),
+                "assists": MOCK_RNG.randint(0, 2),
+                "saves": MOCK_RNG.randint(0, 4),
+                "shots": MOCK_RNG.randint(1, 8),
+                "score": MOCK_RNG.randint(100, 800),
+                "boost_usage": round(MOCK_RNG.uniform(0.3, 0.9), 2),
+                "average_speed": round(MOCK_RNG.uniform(800, 1200), 1),
+                "time_supersonic": round(MOCK_RNG.uniform(10, 60), 1),
+                "time_on_ground": round(MOCK_RNG.uniform(60, 90), 1),
+                "time_low_air": round(MOCK_RNG.uniform(5, 20), 1),
+                "time_high_air": round(MOCK_RNG.uniform(1, 10), 1)
             },
             "analysis_version": "1.0.0",
             "processed_at": datetime.utcnow().isoformat()
@@ -128,12 +128,16 @@ class TrainingService:
     async def get_user_progress(self, user_id: str) -> Dict[str, Any]:
         """Get user's training progress and statistics."""
         try:
-            # Get all training sessions
-            sessions = self.db.query(TrainingSession).filter(
+            # Totals are aggregated in the database rather than over loaded rows
+            total_sessions, total_duration, average_accuracy = self.db.query(
+                func.count(TrainingSession.id),
+                func.sum(TrainingSession.duration),
+                func.avg(TrainingSession.accuracy)
+            ).filter(
                 TrainingSession.user_id == user_id
-            ).all()
+            ).one()
             
-            if not sessions:
+            if not total_sessions:
                 return {
                     "total_sessions": 0,
                     "total_duration": 0,
@@ -143,43 +147,45 @@ class TrainingService:
                     "progress_by_category": {}
                 }
             
-            # Calculate basic stats
-            total_sessions = len(sessions)
-            total_duration = sum(session.duration for session in sessions)
-            average_accuracy = sum(session.accuracy for session in sessions) / total_sessions
-            
-            # Calculate improvement rate (simplified)
-            recent_sessions = sorted(sessions, key=lambda x: x.completed_at)[-10:]
-            old_sessions = sorted(sessions, key=lambda x: x.completed_at)[:10]
+            average_accuracy = average_accuracy or 0.0
             
-            if old_sessions and recent_sessions:
-                old_avg = sum(s.accuracy for s in old_sessions) / len(old_sessions)
-                recent_avg = sum(s.accuracy for s in recent_sessions) / len(recent_sessions)
-                improvement_rate = ((recent_avg - old_avg) / old_avg) * 100 if old_avg > 0 else 0
+            # Calculate improvement rate (simplified): first vs last 10 sessions
+            old_avg = self._average_session_accuracy(user_id, TrainingSession.completed_at.asc())
+            recent_avg = self._average_session_accuracy(user_id, TrainingSession.completed_at.desc())
+            if old_avg and recent_avg is not None:
+                improvement_rate = ((recent_avg - old_avg) / old_avg) * 100
             else:
                 improvement_rate = 0.0
             
-            # Find favorite categories
-            category_counts = {}
-            for session in sessions:
-                category = session.training_pack.category
-                category_counts[category] = category_counts.get(category, 0) + 1
+            # Per-category stats, most played first
+            session_count = func.count(TrainingSession.id)
+            category_rows = self.db.query(
+                TrainingPack.category,
+                session_count,
+                func.avg(TrainingSession.accuracy),
+                func.sum(TrainingSession.duration),
+                func.max(TrainingSession.accuracy)
+            ).join(
+                TrainingPack, TrainingPack.id == TrainingSession.training_pack_id
+            ).filter(
+                TrainingSession.user_id == user_id
+            ).group_by(
+                TrainingPack.category
+            ).order_by(
+                desc(session_count)
+            ).all()
             
-            favorite_categories = sorted(category_counts.keys(), 
-                                       key=lambda x: category_counts[x], 
-                                       reverse=True)[:3]
+            favorite_categories = [row[0] for row in category_rows[:3]]
             
-            # Progress by category
-            progress_by_category = {}
-            for category in category_counts.keys():
-                category_sessions = [s for s in sessions if s.training_pack.category == category]
-                if category_sessions:
-                    progress_by_category[category] = {
-                        "sessions": len(category_sessions),
-                        "average_accuracy": sum(s.accuracy for s in category_sessions) / len(category_sessions),
-                        "total_duration": sum(s.duration for s in category_sessions),
-                        "best_accuracy": max(s.accuracy for s in category_sessions)
-                    }
+            progress_by_category = {
+                category: {
+                    "sessions": sessions,
+                    "average_accuracy": category_accuracy,
+                    "total_duration": category_duration,
+                    "best_accuracy": best_accuracy
+                }
+                for category, sessions, category_accuracy, category_duration, best_accuracy in category_rows
+            }
             
             return {
                 "total_sessions": total_sessions,
@@ -194,6 +200,13 @@ class TrainingService:
             logger.error("Failed to get user progress", user_id=user_id, error=str(e))
             return {}
 
+    def _average_session_accuracy(self, user_id: str, order_by) -> Optional[float]:
+        """Average accuracy of the user's first 10 training sessions in the given order."""
+        first_sessions = self.db.query(TrainingSession.accuracy).filter(
+            TrainingSession.user_id == user_id
+        ).order_by(order_by).limit(10).subquery()
+        return self.db.query(func.avg(first_sessions.c.accuracy)).scalar()
+
     def _get_user_recent_matches(self, user_id: str, limit: int = 10) -> List[Match]:
         """Get user's recent matches for analysis."""
         return (self.db.query(Match)
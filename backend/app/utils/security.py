@@ -1,24 +1,21 @@
 """
 Security utilities for password hashing and token management.
 """
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional
 import jwt
 from app.config import settings
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.services.auth_service import AuthService
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash (Argon2id or legacy bcrypt)."""
+    return AuthService.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return AuthService.hash_password(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
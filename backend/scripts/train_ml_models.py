@@ -60,26 +60,20 @@ def main():
                    total_samples=len(features_df),
                    unique_players=len(set(labels_dict["player_ids"])))
         
-        # Train WeaknessDetector
-        logger.info("Training WeaknessDetector model")
-        weakness_results = trainer.train_weakness_detector(
-            features_df, 
+        # Train WeaknessDetector and SkillAnalyzer
+        logger.info("Training WeaknessDetector and SkillAnalyzer models")
+        results = trainer.train_all(
+            features_df,
             labels_dict,
             optimize_hyperparams=False  # Set to True for better performance but longer training
         )
+        weakness_results = results["weakness_detector"]
+        skill_results = results["skill_analyzer"]
         
         logger.info("WeaknessDetector training completed",
                    train_accuracy=weakness_results["train_accuracy"],
                    test_accuracy=weakness_results["test_accuracy"])
         
-        # Train SkillAnalyzer
-        logger.info("Training SkillAnalyzer model")
-        skill_results = trainer.train_skill_analyzer(
-            features_df,
-            labels_dict,
-            optimize_hyperparams=False  # Set to True for better performance but longer training
-        )
-        
         logger.info("SkillAnalyzer training completed",
                    test_r2=skill_results["test_r2"],
                    overall_mse=skill_results["overall_mse"])
@@ -13,17 +13,13 @@ BEGIN
 
     -- Check if player_stats table exists before converting to hypertable
     IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'player_stats') THEN
-        -- First, drop the primary key constraint that conflicts with partitioning
-        IF EXISTS (SELECT 1 FROM information_schema.table_constraints
-                  WHERE table_name = 'player_stats' AND constraint_type = 'PRIMARY KEY') THEN
-            ALTER TABLE player_stats DROP CONSTRAINT player_stats_pkey;
-            RAISE NOTICE 'Dropped primary key constraint from player_stats';
-        END IF;
+        -- The application keys player_stats on (id, time), which already
+        -- contains the partitioning column, so the primary key can stay.
 
         -- Convert player_stats to hypertable partitioned by time column
         -- Only create if not already a hypertable
         IF NOT EXISTS (SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = 'player_stats') THEN
-            PERFORM create_hypertable('player_stats', 'time', if_not_exists => TRUE);
+            PERFORM create_hypertable('player_stats', 'time', chunk_time_interval => INTERVAL '7 days', if_not_exists => TRUE);
             RAISE NOTICE 'Created hypertable for player_stats partitioned by time';
         ELSE
             RAISE NOTICE 'player_stats hypertable already exists partitioned by time';
@@ -1,11 +1,17 @@
 """
 Test authentication endpoints.
 """
+import time
+from unittest.mock import patch
+
+import jwt
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.user import User
+from app.services.auth_service import AuthService, TOKEN_CACHE_SECONDS, _decode_token
 
 
 def test_steam_login_new_user(client: TestClient, db: Session):
@@ -72,3 +78,54 @@ def test_logout(client: TestClient, test_user: User):
     
     assert response.status_code == 200
     assert response.json()["message"] == "Successfully logged out"
+
+
+def _token_expiring_at(exp: int) -> str:
+    """Encode a token for a test user that expires at the given timestamp."""
+    return jwt.encode(
+        {"sub": "76561198000000001", "exp": exp},
+        settings.secret_key,
+        algorithm=settings.algorithm
+    )
+
+
+def test_verify_token_rejects_expired_cached_payload():
+    """Test an expired token is rejected even while its payload is cached."""
+    _decode_token.cache_clear()
+    # Expiry in the real future, far enough into its bucket that both checks
+    # below land in the same bucket
+    bucket = int(time.time()) // TOKEN_CACHE_SECONDS + 2
+    exp = bucket * TOKEN_CACHE_SECONDS + 10
+    token = _token_expiring_at(exp)
+
+    with patch("app.services.auth_service.time") as mock_time:
+        mock_time.time.return_value = exp - 5
+        assert AuthService.verify_token(token)["sub"] == "76561198000000001"
+
+        mock_time.time.return_value = exp + 5
+        assert AuthService.verify_token(token) is None
+
+    assert _decode_token.cache_info().hits == 1
+
+
+def test_verify_token_invalid_token():
+    """Test an invalid token returns None."""
+    _decode_token.cache_clear()
+    assert AuthService.verify_token("not-a-jwt") is None
+
+    tampered = AuthService.create_access_token({"sub": "76561198000000001"}) + "x"
+    assert AuthService.verify_token(tampered) is None
+
+
+def test_verify_token_returns_copy_of_cached_payload():
+    """Test mutating a returned payload does not change the cached one."""
+    _decode_token.cache_clear()
+    token = AuthService.create_access_token({"sub": "76561198000000001"})
+
+    payload = AuthService.verify_token(token)
+    payload["sub"] = "someone-else"
+    payload["admin"] = True
+
+    again = AuthService.verify_token(token)
+    assert again["sub"] == "76561198000000001"
+    assert "admin" not in again
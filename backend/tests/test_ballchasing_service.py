@@ -0,0 +1,30 @@
+"""
+Test the Ballchasing.com service's replay caching.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.ballchasing_service import BallchasingService
+
+
+def test_corrupt_cached_replay_falls_back_to_fetch():
+    """Test a corrupt Redis entry is deleted and the replay fetched over HTTP."""
+    response = MagicMock(status=200)
+    response.read = AsyncMock(return_value=b'{"id": "abc123", "status": "ok"}')
+    session = MagicMock()
+    session.get = AsyncMock(return_value=response)
+
+    with patch("app.services.ballchasing_service.settings.ballchasing_api_key", "test-key"), \
+         patch("app.services.ballchasing_service.redis_client") as redis_client:
+        redis_client.get = AsyncMock(return_value=b'{"id": "abc1')
+        redis_client.delete = AsyncMock()
+        redis_client.setex = AsyncMock()
+
+        service = BallchasingService()
+        service._get_session = AsyncMock(return_value=session)
+        replay = asyncio.run(service.get_replay("abc123"))
+
+    assert replay == {"id": "abc123", "status": "ok"}
+    redis_client.delete.assert_awaited_once_with("bc:replay:abc123")
+    session.get.assert_awaited_once()
+    redis_client.setex.assert_awaited_once()
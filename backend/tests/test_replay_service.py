@@ -0,0 +1,171 @@
+"""
+Test Ballchasing replay processing and player stats recording.
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.player_stats import PlayerStats
+from app.services.replay_service import BALLCHASING_BATCH_SIZE, PLAYER_STAT_ROWS, ReplayService
+from app.tasks.replay_processing import process_ballchasing_batch
+
+
+REPLAY_STATS = {
+    "match_info": {
+        "playlist": "ranked-doubles",
+        "duration": 300,
+        "date": "2024-01-15T18:30:00Z",
+        "score": {"blue": 3, "orange": 1},
+    },
+    "players": [
+        {"player_id": "76561198000000000", "player_name": "testuser", "team": "blue"},
+    ],
+}
+
+USER_STATS = {
+    "player_name": "testuser",
+    "team": "blue",
+    "goals": 2,
+    "assists": 1,
+    "saves": 3,
+    "shots": 5,
+    "score": 540,
+    "boost_usage": 0.55,
+    "average_speed": 1010.0,
+    "time_supersonic": 0.2,
+    "time_on_ground": 0.7,
+    "time_low_air": 0.2,
+    "time_high_air": 0.1,
+}
+
+
+def _match_row(ballchasing_id: str) -> SimpleNamespace:
+    """Build a row shaped like the batch's joined Match/User SELECT."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        ballchasing_id=ballchasing_id,
+        steam_id="76561198000000000"
+    )
+
+
+def test_process_ballchasing_batch_task():
+    """Test the batch task writes fetched replays with one UPDATE."""
+    fetched, missing = _match_row("replay-ok"), _match_row("replay-missing")
+
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [fetched, missing]
+
+    ballchasing = MagicMock()
+    ballchasing.get_replay_stats_many = AsyncMock(return_value={"replay-ok": REPLAY_STATS})
+    ballchasing.extract_player_stats_for_user.return_value = USER_STATS
+
+    with patch("app.services.replay_service.SessionLocal", return_value=session), \
+         patch("app.services.replay_service.get_ballchasing_service", return_value=ballchasing), \
+         patch("app.services.replay_service.PlayerStats.bulk_insert", return_value=11) as bulk_insert, \
+         patch.object(ReplayService, "_mark_match_failed") as mark_failed, \
+         patch("app.tasks.replay_processing.close_ballchasing_service", new=AsyncMock()) as close_service, \
+         patch("app.tasks.replay_processing.redis_client") as redis_client:
+        redis_client.connection_pool.disconnect = AsyncMock()
+
+        result = process_ballchasing_batch.apply(
+            args=[[str(fetched.id), str(missing.id)]]
+        ).get()
+
+    assert result == {"status": "success", "requested": 2, "updated": 1}
+
+    # Both replays are requested in one concurrent fetch
+    ballchasing.get_replay_stats_many.assert_awaited_once_with(["replay-ok", "replay-missing"])
+    mark_failed.assert_called_once_with(str(missing.id), "Failed to fetch from Ballchasing.com")
+
+    # The successful match is written through a single executemany UPDATE
+    update_calls = [c for c in session.execute.call_args_list if len(c.args) == 2]
+    assert len(update_calls) == 1
+    updates = update_calls[0].args[1]
+    assert [u["id"] for u in updates] == [fetched.id]
+    assert updates[0]["goals"] == 2
+    assert updates[0]["result"] == "win"
+
+    # Its stats go to the time-series table, keyed to the match and user
+    rows = bulk_insert.call_args.args[1]
+    assert {row["match_id"] for row in rows} == {fetched.id}
+    assert {row["user_id"] for row in rows} == {fetched.user_id}
+
+    close_service.assert_awaited_once()
+    redis_client.connection_pool.disconnect.assert_awaited_once()
+
+
+def test_queue_ballchasing_batches_chunks_match_ids():
+    """Test imported matches are queued in chunks of BALLCHASING_BATCH_SIZE."""
+    match_ids = [str(uuid.uuid4()) for _ in range(BALLCHASING_BATCH_SIZE * 2 + 1)]
+
+    with patch("app.services.replay_service.process_ballchasing_batch_task") as task:
+        task.delay.side_effect = lambda chunk: SimpleNamespace(id=f"task-{len(chunk)}")
+
+        task_ids = ReplayService.queue_ballchasing_batches(match_ids)
+
+    chunks = [c.args[0] for c in task.delay.call_args_list]
+    assert chunks == [
+        match_ids[:BALLCHASING_BATCH_SIZE],
+        match_ids[BALLCHASING_BATCH_SIZE:BALLCHASING_BATCH_SIZE * 2],
+        match_ids[BALLCHASING_BATCH_SIZE * 2:],
+    ]
+    assert task_ids == [f"task-{BALLCHASING_BATCH_SIZE}", f"task-{BALLCHASING_BATCH_SIZE}", "task-1"]
+
+
+def test_process_ballchasing_replay_records_player_stats():
+    """Test a processed replay writes one stat row per tracked stat."""
+    row = _match_row("replay-ok")
+
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = row
+
+    ballchasing = MagicMock()
+    ballchasing.get_replay_stats = AsyncMock(return_value=REPLAY_STATS)
+    ballchasing.extract_player_stats_for_user.return_value = USER_STATS
+
+    with patch("app.services.replay_service.SessionLocal", return_value=session), \
+         patch("app.services.replay_service.get_ballchasing_service", return_value=ballchasing), \
+         patch("app.services.replay_service.PlayerStats.bulk_insert", return_value=len(PLAYER_STAT_ROWS)) as bulk_insert:
+        asyncio.run(ReplayService.process_ballchasing_replay(str(row.id), "replay-ok"))
+
+    bulk_insert.assert_called_once()
+    rows = bulk_insert.call_args.args[1]
+    assert [r["stat_type"] for r in rows] == [stat_type for stat_type, _, _ in PLAYER_STAT_ROWS]
+    assert {(r["match_id"], r["user_id"]) for r in rows} == {(row.id, row.user_id)}
+    by_type = {r["stat_type"]: r["value"] for r in rows}
+    assert by_type["goals"] == 2.0
+    assert by_type["match_performance"] == 540.0
+    session.commit.assert_called()
+
+
+def test_player_stats_rows_need_user_stats():
+    """Test no stat rows are built when the user wasn't found in the replay."""
+    with patch("app.services.replay_service.get_ballchasing_service") as service:
+        service.return_value.extract_player_stats_for_user.return_value = None
+        match_updates = ReplayService._build_match_updates("match", "replay-ok", REPLAY_STATS, None)
+
+    assert ReplayService._player_stats_rows(uuid.uuid4(), uuid.uuid4(), match_updates) == []
+
+
+def test_bulk_insert_skips_duplicate_stats():
+    """Test bulk inserts ignore rows already recorded for the match."""
+    rows = [
+        {"time": None, "user_id": uuid.uuid4(), "match_id": uuid.uuid4(),
+         "stat_type": "goals", "category": "core", "value": 1.0},
+        {"time": None, "user_id": uuid.uuid4(), "match_id": uuid.uuid4(),
+         "stat_type": "saves", "category": "core", "value": 2.0},
+    ]
+    session = MagicMock()
+
+    # Only the first row is new; the second conflicts and returns nothing
+    with patch("app.models.player_stats.register_uuid"), \
+         patch("app.models.player_stats.execute_values", return_value=[(1,)]) as execute_values:
+        inserted = PlayerStats.bulk_insert(session, rows)
+
+    assert inserted == 1
+    query = execute_values.call_args.args[1]
+    assert query.endswith("ON CONFLICT DO NOTHING RETURNING 1")
+    assert execute_values.call_args.kwargs["fetch"] is True
+    assert len(execute_values.call_args.args[2]) == 2